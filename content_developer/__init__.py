@@ -0,0 +1,5 @@
+"""
+AI Content Developer
+"""
+
+__version__ = "1.0.0"
@@ -2,45 +2,172 @@
 Unified cache system for AI Content Developer
 """
 import json
+import os
+import sqlite3
 import threading
+from collections import OrderedDict
+from fnmatch import fnmatch
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Iterable, Optional, List, Tuple
 import logging
 
-from ..utils import save_json, load_json, mkdir
+from ..utils import save_json, load_json, dumps_json, loads_json, mkdir
 
 logger = logging.getLogger(__name__)
 
+# Number of manifest changes buffered in memory before they are written out
+MANIFEST_FLUSH_INTERVAL = 50
+
+# SQLite database holding every cache entry, keyed by cache key
+ENTRIES_DB_NAME = "entries.db"
+
+# Decoded entries kept in memory per cache instance (least recently used are evicted)
+ENTRY_MEMO_SIZE = 4096
+
+# Keys per SELECT ... IN (...) query in get_many, below SQLite's bound-parameter limit
+GET_MANY_BATCH_SIZE = 500
+
 
 class UnifiedCache:
-    """Thread-safe cache system with manifest recovery"""
+    """Thread-safe cache system with manifest recovery
+    
+    Entries live in a single SQLite database (WAL mode) instead of one JSON
+    file per key; the manifest stays a JSON file next to it.
+    """
     
     def __init__(self, base_path: Path):
         self.path = Path(base_path)
         self.manifest_path = self.path / "manifest.json"
+        self.db_path = self.path / ENTRIES_DB_NAME
         self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._manifest_version = None  # (mtime_ns, size) of the manifest as last read or written
+        self._pending = set()  # Keys changed in memory but not yet written
+        self._memo = OrderedDict()  # key -> decoded entry, most recently used last
         mkdir(self.path)
         
+        self._db = self._open_db()
+        self._import_legacy_entries()
+        
         # Try to load manifest, recover if corrupted
         try:
             self.manifest = load_json(self.manifest_path)
+            self._manifest_version = self._manifest_stat()
         except Exception as e:
             logger.warning(f"Manifest corrupted, attempting recovery: {e}")
             self.manifest = self._recover_manifest()
     
+    def _open_db(self) -> sqlite3.Connection:
+        """Open the entries database, creating the table on first use"""
+        db = sqlite3.connect(self.db_path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+        db.commit()
+        return db
+    
+    def _import_legacy_entries(self):
+        """Move entries from the old one-JSON-file-per-key layout into the database"""
+        legacy_files = [f for f in self.path.glob("*.json") if f.name != "manifest.json"]
+        if not legacy_files:
+            return
+        
+        rows = []
+        for json_file in legacy_files:
+            try:
+                rows.append((json_file.stem, json_file.read_bytes()))
+            except OSError as e:
+                logger.warning(f"Could not import legacy cache file {json_file}: {e}")
+        
+        with self._db_lock, self._db:
+            self._db.executemany("INSERT OR IGNORE INTO entries (key, value) VALUES (?, ?)", rows)
+        
+        for json_file in legacy_files:
+            try:
+                json_file.unlink()
+            except OSError:
+                pass
+        logger.info(f"Imported {len(rows)} legacy cache files into {self.db_path.name}")
+    
+    def _write_entry(self, key: str, payload: bytes):
+        """Store and commit an entry
+        
+        Each write is its own short transaction: nothing paid for is lost on an
+        interrupt, and the database write lock is never held across callers'
+        network requests. WAL with synchronous=NORMAL keeps commits cheap.
+        """
+        with self._db_lock, self._db:
+            self._memo.pop(key, None)
+            self._db.execute("INSERT OR REPLACE INTO entries (key, value) VALUES (?, ?)", (key, payload))
+    
+    def _write_entries(self, rows: List[Tuple[str, bytes]]):
+        """Store and commit many (key, payload) entries in one transaction"""
+        with self._db_lock, self._db:
+            for key, _ in rows:
+                self._memo.pop(key, None)
+            self._db.executemany("INSERT OR REPLACE INTO entries (key, value) VALUES (?, ?)", rows)
+    
+    def _delete_entries(self, keys: List[str]) -> int:
+        """Delete entries in one transaction and return how many existed"""
+        with self._db_lock, self._db:
+            for key in keys:
+                self._memo.pop(key, None)
+            cursor = self._db.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in keys])
+        return cursor.rowcount
+    
+    def _entry_keys(self) -> set:
+        """Return the set of all stored entry keys"""
+        with self._db_lock:
+            return {row[0] for row in self._db.execute("SELECT key FROM entries")}
+    
+    def _commit(self):
+        """Commit any open transaction (entry writes commit on their own)"""
+        with self._db_lock:
+            self._db.commit()
+    
+    def _manifest_stat(self) -> Optional[Tuple[int, int]]:
+        """Return the manifest's (mtime_ns, size), or None if it is missing"""
+        try:
+            stat = os.stat(self.manifest_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _save_manifest(self):
+        """Write the manifest and record its stat so an unchanged file is not re-read"""
+        self._commit()
+        save_json(self.manifest_path, self.manifest, compact=True)
+        self._manifest_version = self._manifest_stat()
+        self._pending.clear()
+    
+    def _mark_dirty(self, key: str):
+        """Record a manifest change, writing the manifest every MANIFEST_FLUSH_INTERVAL changes"""
+        self._pending.add(key)
+        if len(self._pending) >= MANIFEST_FLUSH_INTERVAL:
+            self._save_manifest()
+    
+    def flush(self):
+        """Write any buffered manifest changes to disk"""
+        with self._lock:
+            try:
+                if self._pending:
+                    self._save_manifest()
+                else:
+                    self._commit()
+            except Exception as e:
+                logger.error(f"Failed to flush cache manifest: {e}")
+    
     def _recover_manifest(self) -> Dict[str, Any]:
-        """Recover manifest from existing cache files"""
+        """Recover manifest from existing cache entries"""
         manifest = {}
         
-        # Scan for all JSON files except manifest
-        for json_file in self.path.glob("*.json"):
-            if json_file.name == "manifest.json":
-                continue
-            
+        with self._db_lock:
+            rows = self._db.execute("SELECT key, value FROM entries").fetchall()
+        
+        for chunk_id, payload in rows:
             try:
-                data = load_json(json_file)
-                chunk_id = json_file.stem
+                data = loads_json(payload)
                 
                 # Add to manifest
                 manifest[chunk_id] = {
@@ -48,50 +175,136 @@ class UnifiedCache:
                     'meta': data.get('meta', {})
                 }
             except Exception as e:
-                logger.warning(f"Could not recover {json_file}: {e}")
+                logger.warning(f"Could not recover cache entry {chunk_id}: {e}")
         
         # Save recovered manifest
-        save_json(self.manifest_path, manifest)
+        save_json(self.manifest_path, manifest, compact=True)
+        self._manifest_version = self._manifest_stat()
         logger.info(f"Recovered manifest with {len(manifest)} entries")
         return manifest
     
     def reload_manifest(self):
-        """Reload manifest from disk with error recovery"""
+        """Reload manifest from disk with error recovery
+        
+        Skips the read when the file's mtime and size are unchanged since it
+        was last read or written. Buffered changes are kept on top of the
+        reloaded data.
+        """
+        version = self._manifest_stat()
+        if version is not None and version == self._manifest_version:
+            return
+        
         try:
-            self.manifest = load_json(self.manifest_path)
+            manifest = load_json(self.manifest_path)
+            self._manifest_version = version
         except Exception as e:
             logger.warning(f"Manifest reload failed, recovering: {e}")
-            self.manifest = self._recover_manifest()
+            manifest = self._recover_manifest()
+        
+        for key in self._pending:
+            if key in self.manifest:
+                manifest[key] = self.manifest[key]
+            else:
+                manifest.pop(key, None)
+        self.manifest = manifest
     
     def get(self, key: str) -> Optional[Dict[str, Any]]:
-        """Get cached data by key"""
-        cache_file = self.path / f"{key}.json"
+        """Get cached data by key
+        
+        Decoded entries are memoized, so repeated reads of a key skip the
+        database and JSON decode. The returned dict is shared: change an
+        entry through put(), not by mutating it in place.
+        """
         try:
-            return load_json(cache_file) if cache_file.exists() else None
+            # Read, decode and memoize under one lock so a concurrent put cannot be
+            # overwritten by the stale entry it replaced
+            with self._db_lock:
+                if (entry := self._memo.get(key)) is not None:
+                    self._memo.move_to_end(key)
+                    return entry
+                
+                row = self._db.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                entry = loads_json(row[0])
+                
+                self._memo[key] = entry
+                if len(self._memo) > ENTRY_MEMO_SIZE:
+                    self._memo.popitem(last=False)
+                return entry
         except Exception as e:
             logger.warning(f"Cache file {key} corrupted: {e}")
             return None
     
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get cached data for many keys with one query per batch; missing keys are left out"""
+        entries = {}
+        with self._db_lock:
+            missing = []
+            for key in keys:
+                if (entry := self._memo.get(key)) is not None:
+                    entries[key] = entry
+                else:
+                    missing.append(key)
+            
+            rows = []
+            for start in range(0, len(missing), GET_MANY_BATCH_SIZE):
+                batch = missing[start:start + GET_MANY_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows.extend(self._db.execute(
+                    f"SELECT key, value FROM entries WHERE key IN ({placeholders})", batch
+                ))
+        
+        for key, payload in rows:
+            try:
+                entries[key] = loads_json(payload)
+            except Exception as e:
+                logger.warning(f"Cache file {key} corrupted: {e}")
+        return entries
+    
     def put(self, key: str, data: Any, meta: Optional[Dict] = None):
         """Store data in cache with metadata"""
         with self._lock:
             try:
-                cache_file = self.path / f"{key}.json"
-                save_json(cache_file, {
+                self._write_entry(key, dumps_json({
                     'data': data, 
                     'meta': meta or {}, 
                     'timestamp': datetime.now().isoformat()
-                })
+                }, compact=True))
                 # Reload manifest to get latest changes
                 self.reload_manifest()
                 self.manifest[key] = {
                     'timestamp': datetime.now().isoformat(), 
                     'meta': meta
                 }
-                save_json(self.manifest_path, self.manifest)
+                self._mark_dirty(key)
             except Exception as e:
                 logger.error(f"Failed to save cache entry {key}: {e}")
     
+    def put_many(self, items: Iterable[Tuple[str, Any, Optional[Dict]]]):
+        """Store several (key, data, meta) entries under one lock and one manifest reload"""
+        with self._lock:
+            rows = []
+            manifest_entries = {}
+            try:
+                timestamp = datetime.now().isoformat()
+                for key, data, meta in items:
+                    rows.append((key, dumps_json({
+                        'data': data, 
+                        'meta': meta or {}, 
+                        'timestamp': timestamp
+                    }, compact=True)))
+                    manifest_entries[key] = {'timestamp': timestamp, 'meta': meta}
+                self._write_entries(rows)
+                
+                # Reload manifest to get latest changes
+                self.reload_manifest()
+                for key, entry in manifest_entries.items():
+                    self.manifest[key] = entry
+                    self._mark_dirty(key)
+            except Exception as e:
+                logger.error(f"Failed to save {len(rows)} cache entries: {e}")
+    
     def update_manifest_entry(self, key: str, value: Dict[str, Any]):
         """Thread-safe method to update a manifest entry with reload"""
         with self._lock:
@@ -99,7 +312,7 @@ class UnifiedCache:
                 # Reload to get latest changes from other threads
                 self.reload_manifest()
                 self.manifest[key] = value
-                save_json(self.manifest_path, self.manifest)
+                self._mark_dirty(key)
             except Exception as e:
                 logger.error(f"Failed to update manifest entry {key}: {e}")
     
@@ -125,24 +338,21 @@ class UnifiedCache:
                 return True  # Assume update needed if we can't check
     
     def remove_old(self, pattern: str):
-        """Remove old cache files matching pattern"""
+        """Remove old cache entries whose legacy file name (<key>.json) matches pattern"""
+        matching = [key for key in self._entry_keys() if fnmatch(f"{key}.json", pattern)]
         removed_count = 0
-        for file in self.path.glob(pattern):
-            if file.name != "manifest.json":
-                try:
-                    file.unlink()
-                    removed_count += 1
-                    # Remove from manifest if it's there
-                    chunk_id = file.stem
-                    if chunk_id in self.manifest:
-                        del self.manifest[chunk_id]
-                except Exception as e:
-                    logger.warning(f"Failed to remove {file}: {e}")
+        if matching:
+            try:
+                removed_count = self._delete_entries(matching)
+            except Exception as e:
+                logger.warning(f"Failed to remove cache entries matching '{pattern}': {e}")
         
         if removed_count > 0:
-            # Save updated manifest
-            save_json(self.manifest_path, self.manifest)
-            logger.info(f"Removed {removed_count} cache files matching pattern '{pattern}'")
+            # Remove from manifest and save
+            for chunk_id in matching:
+                self.manifest.pop(chunk_id, None)
+            self._save_manifest()
+            logger.info(f"Removed {removed_count} cache entries matching pattern '{pattern}'")
         
         return removed_count
     
@@ -164,7 +374,7 @@ class UnifiedCache:
             
             if removed_count > 0:
                 logger.info(f"Cleaned up {removed_count} orphaned chunks for {file_key}")
-                save_json(self.manifest_path, self.manifest)
+                self._save_manifest()
         
         return len(orphaned_chunks)
     
@@ -176,34 +386,19 @@ class UnifiedCache:
         return set(old_chunk_ids) - set(current_chunk_ids)
     
     def _remove_orphaned_chunks(self, orphaned_chunks: set) -> int:
-        """Remove orphaned chunk files from disk"""
-        removed_count = 0
+        """Remove orphaned chunk entries and their manifest entries"""
+        try:
+            removed_count = self._delete_entries(list(orphaned_chunks))
+        except Exception as e:
+            logger.warning(f"Failed to remove orphaned chunks: {e}")
+            return 0
         
+        # Remove from manifest if they exist as separate entries
         for chunk_id in orphaned_chunks:
-            if self._remove_chunk_file(chunk_id):
-                removed_count += 1
+            self.manifest.pop(chunk_id, None)
         
         return removed_count
     
-    def _remove_chunk_file(self, chunk_id: str) -> bool:
-        """Remove a single chunk file and its manifest entry"""
-        chunk_file = self.path / f"{chunk_id}.json"
-        
-        if not chunk_file.exists():
-            return False
-            
-        try:
-            chunk_file.unlink()
-            
-            # Remove from manifest if it exists as a separate entry
-            if chunk_id in self.manifest:
-                del self.manifest[chunk_id]
-            
-            return True
-        except Exception as e:
-            logger.warning(f"Failed to remove orphaned chunk {chunk_id}: {e}")
-            return False
-    
     def verify_and_cleanup_manifest(self):
         """
         Verify manifest entries and clean up entries for files that no longer exist
@@ -220,34 +415,26 @@ class UnifiedCache:
         """Validate all manifest entries and return lists of invalid ones"""
         entries_to_remove = []
         chunks_to_remove = []
+        stored_keys = self._entry_keys()
         
         for key, entry in self.manifest.items():
             if 'meta' in entry:
                 # This is a chunk entry
-                if not self._validate_chunk_entry(key):
+                if key not in stored_keys:
                     chunks_to_remove.append(key)
             elif 'chunk_ids' in entry:
                 # This is a file entry
-                if not self._validate_file_entry(key, entry):
+                if not self._validate_file_entry(key, entry, stored_keys):
                     entries_to_remove.append(key)
         
         return entries_to_remove, chunks_to_remove
     
-    def _validate_chunk_entry(self, key: str) -> bool:
-        """Validate a chunk entry exists on disk"""
-        chunk_file = self.path / f"{key}.json"
-        return chunk_file.exists()
-    
-    def _validate_file_entry(self, key: str, entry: Dict) -> bool:
+    def _validate_file_entry(self, key: str, entry: Dict, stored_keys: set) -> bool:
         """Validate a file entry and update its chunk list"""
         chunk_ids = entry.get('chunk_ids', [])
-        existing_chunks = []
         
         # Find existing chunks
-        for chunk_id in chunk_ids:
-            chunk_file = self.path / f"{chunk_id}.json"
-            if chunk_file.exists():
-                existing_chunks.append(chunk_id)
+        existing_chunks = [chunk_id for chunk_id in chunk_ids if chunk_id in stored_keys]
         
         # Update the entry if chunks have changed
         if len(existing_chunks) != len(chunk_ids):
@@ -269,7 +456,7 @@ class UnifiedCache:
             del self.manifest[key]
         
         # Save updated manifest
-        save_json(self.manifest_path, self.manifest)
+        self._save_manifest()
         logger.info(f"Cleaned up manifest: {len(entries_to_remove)} file entries, "
                    f"{len(chunks_to_remove)} chunk entries")
     
@@ -2,16 +2,24 @@
 Smart chunking system for markdown files
 """
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+import re
 import yaml
 import logging
 
 from ..models import DocumentChunk
 from ..cache import UnifiedCache
-from ..utils import file_ops, get_hash
+from ..constants import FRONTMATTER_SCAN_LIMIT
+from ..utils import file_ops, get_hash, new_content_hasher
 
 logger = logging.getLogger(__name__)
 
+# Any line starting with '#' is treated as a heading
+_HEADING_LINE_RE = re.compile(r'^#.*$', re.M)
+
+# libyaml-backed safe loader when PyYAML was built with it, pure Python otherwise
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class SmartChunker:
     """Smart chunking for markdown files with heading awareness"""
@@ -20,13 +28,19 @@ class SmartChunker:
         self.max_size = max_size
         self.min_size = min_size
     
-    def chunk_markdown(self, file_path: Path, cache: UnifiedCache) -> List[DocumentChunk]:
-        """Chunk a markdown file into semantic chunks"""
+    def chunk_markdown(self, file_path: Path, cache: UnifiedCache, 
+                       file_id: Optional[str] = None) -> List[DocumentChunk]:
+        """Chunk a markdown file into semantic chunks
+        
+        Pass the file's content hash as file_id when the caller already has it,
+        so the file is not read and hashed a second time.
+        """
         content = file_ops.read(file_path, limit=None)
         frontmatter, body = self._parse_frontmatter(content)
         
         chunks = []
-        file_id = file_ops.get_hash(file_path)
+        if file_id is None:
+            file_id = file_ops.get_hash(file_path)
         self._process_body(body, file_path, frontmatter, file_id, chunks, cache)
         
         # Link chunks
@@ -39,12 +53,16 @@ class SmartChunker:
         return chunks
     
     def _parse_frontmatter(self, content: str) -> tuple:
-        """Parse YAML frontmatter from markdown content"""
+        """Parse YAML frontmatter from markdown content
+        
+        Only the head of the file is searched for the closing delimiter, so a
+        document without frontmatter is not scanned end to end.
+        """
         if content.startswith('---'):
-            parts = content.split('---', 2)
-            if len(parts) >= 3:
+            end = content.find('\n---', 3, FRONTMATTER_SCAN_LIMIT)
+            if end != -1:
                 try:
-                    return yaml.safe_load(parts[1]) or {}, parts[2]
+                    return yaml.load(content[3:end], Loader=_YAML_LOADER) or {}, content[end + 4:]
                 except yaml.YAMLError:
                     pass
         return {}, content
@@ -55,27 +73,27 @@ class SmartChunker:
         # Initialize processing state
         state = self._initialize_processing_state()
         
-        # Process each line
-        for line in body.split('\n'):
-            if line.startswith('#'):
-                # Process heading line
-                self._process_heading_line(line, state, file_path, frontmatter, 
-                                         file_id, chunks)
-            else:
-                # Add content line
-                state['current_chunk'] += line + '\n'
+        # Jump between heading lines; the text between them is buffered as one slice
+        position = 0
+        for match in _HEADING_LINE_RE.finditer(body):
+            state['current_lines'].append(body[position:match.start()])
+            self._process_heading_line(match.group(), state, file_path, frontmatter, 
+                                     file_id, chunks)
+            position = match.end() + 1
+        state['current_lines'].append(body[position:])
         
         # Add final chunk if exists
-        if state['current_chunk'].strip():
-            self._add_chunks(state['current_chunk'].strip(), file_path, 
+        if current_chunk := self._current_chunk_text(state):
+            self._add_chunks(current_chunk, file_path, 
                            state['heading_stack'], frontmatter, file_id, 
                            state['current_parent_id'], chunks)
     
     def _initialize_processing_state(self) -> Dict:
         """Initialize state for processing markdown body"""
         return {
-            'current_chunk': "",
+            'current_lines': [],
             'heading_stack': [],
+            'heading_paths': [],  # heading_paths[i] == ' > '.join(heading_stack[:i + 1])
             'heading_to_chunk_id': {},
             'current_parent_id': None
         }
@@ -84,8 +102,8 @@ class SmartChunker:
                              frontmatter: Dict, file_id: str, chunks: List):
         """Process a heading line and update state"""
                 # Save current chunk if exists
-        if state['current_chunk'].strip():
-            self._add_chunks(state['current_chunk'].strip(), file_path, 
+        if current_chunk := self._current_chunk_text(state):
+            self._add_chunks(current_chunk, file_path, 
                            state['heading_stack'][:], frontmatter, file_id, 
                            state['current_parent_id'], chunks)
         
@@ -94,19 +112,26 @@ class SmartChunker:
                 
                 # Update heading stack
         state['heading_stack'] = state['heading_stack'][:level-1] + [heading]
+        heading_paths = state['heading_paths'][:level-1]
+        heading_paths.append(f"{heading_paths[-1]} > {heading}" if heading_paths else heading)
+        state['heading_paths'] = heading_paths
                 
         # Track heading chunk ID
-        heading_path = ' > '.join(state['heading_stack'])
+        heading_path = heading_paths[-1]
         current_chunk_id = get_hash(f"{file_id}_{heading_path}")
         state['heading_to_chunk_id'][heading_path] = current_chunk_id
                 
                 # Determine parent
         state['current_parent_id'] = self._determine_parent_id(
-            level, state['heading_stack'], state['heading_to_chunk_id']
+            level, heading_paths, state['heading_to_chunk_id']
         )
         
         # Start new chunk with heading
-        state['current_chunk'] = line + '\n'
+        state['current_lines'] = [line]
+    
+    def _current_chunk_text(self, state: Dict) -> str:
+        """Join the buffered lines (or body slices) of the current chunk into stripped text"""
+        return '\n'.join(state['current_lines']).strip()
     
     def _parse_heading(self, line: str) -> tuple:
         """Parse heading level and text from a heading line"""
@@ -114,12 +139,11 @@ class SmartChunker:
         heading = line.lstrip('# ').strip()
         return level, heading
     
-    def _determine_parent_id(self, level: int, heading_stack: List[str], 
+    def _determine_parent_id(self, level: int, heading_paths: List[str], 
                             heading_to_chunk_id: Dict[str, str]) -> Optional[str]:
         """Determine parent chunk ID for current heading"""
-        if level > 1 and len(heading_stack) > 1:
-            parent_heading = ' > '.join(heading_stack[:-1])
-            return heading_to_chunk_id.get(parent_heading)
+        if level > 1 and len(heading_paths) > 1:
+            return heading_to_chunk_id.get(heading_paths[-2])
         return None
     
     def _add_chunks(self, content: str, file_path: Path, heading_path: List[str], 
@@ -137,50 +161,74 @@ class SmartChunker:
         if len(content) <= self.max_size:
             return [content]
         
-        paragraphs = content.split('\n\n')
-        return self._process_paragraphs_into_chunks(paragraphs) or [content]
+        return self._process_paragraphs_into_chunks(content) or [content]
     
-    def _process_paragraphs_into_chunks(self, paragraphs: List[str]) -> List[str]:
-        """Process paragraphs into properly sized chunks"""
+    def _process_paragraphs_into_chunks(self, content: str) -> List[str]:
+        """Process paragraphs into properly sized chunks
+        
+        Paragraphs are tracked as (start, end) offsets into content, and each
+        chunk is sliced out once when it is emitted. A chunk spanning several
+        paragraphs is the same text as joining them back with blank lines.
+        """
         chunks = []
-        current = ""
+        start = None  # Offset where the current chunk starts; None while it is empty
+        end = 0
+        current_len = 0  # Length of the current paragraphs, each counted with its '\n\n'
         
-        for para in paragraphs:
-            current = self._add_paragraph_to_chunk(para, current, chunks)
+        for para_start, para_end in self._paragraph_spans(content):
+            para_len = para_end - para_start + 2
+            
+            # Check if paragraph fits in current chunk
+            if current_len + para_len <= self.max_size:
+                if start is None:
+                    start = para_start
+                end = para_end
+                current_len += para_len
+                continue
+            
+            # Current chunk is large enough, save it and start new
+            if current_len >= self.min_size:
+                chunks.append(self._slice_chunk(content, start, end))
+                start, end, current_len = para_start, para_end, para_len
+                continue
+            
+            # Current chunk is too small, force add paragraph
+            if start is None:
+                start = para_start
+            end = para_end
+            current_len += para_len
+            
+            # Check if forced addition made it large enough
+            if current_len >= self.min_size:
+                chunks.append(self._slice_chunk(content, start, end))
+                start, current_len = None, 0
         
         # Handle any remaining content
-        if current.strip():
-            chunks.append(current.strip())
+        if remaining := self._slice_chunk(content, start, end):
+            chunks.append(remaining)
         
         return chunks
     
-    def _add_paragraph_to_chunk(self, para: str, current: str, chunks: List[str]) -> str:
-        """Add a paragraph to the current chunk or start a new one"""
-        # Check if paragraph fits in current chunk
-        if len(current) + len(para) + 2 <= self.max_size:
-            return current + para + '\n\n'
-        
-        # Current chunk is large enough, save it and start new
-        if len(current) >= self.min_size:
-            chunks.append(current.strip())
-            return para + '\n\n'
-        
-        # Current chunk is too small, force add paragraph
-        current += para + '\n\n'
-        
-        # Check if forced addition made it large enough
-        if len(current) >= self.min_size:
-            chunks.append(current.strip())
-            return ""
-        
-        return current
+    @staticmethod
+    def _paragraph_spans(content: str) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) offsets of the paragraphs content.split('\n\n') would return"""
+        start = 0
+        while (end := content.find('\n\n', start)) != -1:
+            yield start, end
+            start = end + 2
+        yield start, len(content)
+    
+    @staticmethod
+    def _slice_chunk(content: str, start: Optional[int], end: int) -> str:
+        """Return the stripped chunk text between two offsets ('' for an empty chunk)"""
+        return content[start:end].strip() if start is not None else ""
     
     def _create_chunk(self, content: str, file_path: Path, heading_path: List[str], 
                      frontmatter: Dict, index: int, file_id: str, chunk_id: str, 
                      parent_id: str) -> DocumentChunk:
         """Create a DocumentChunk with metadata"""
-        # Build embedding content
-        embedding_content = self._build_embedding_content(content, frontmatter, heading_path)
+        # Build embedding content and its hash in one pass over the parts
+        embedding_content, content_hash = self._build_embedding_content(content, frontmatter, heading_path)
         
         # Create chunk
         return DocumentChunk(
@@ -192,15 +240,15 @@ class SmartChunker:
             frontmatter=frontmatter,
             embedding_content=embedding_content,
             embedding=None,  # No embedding yet
-            content_hash=get_hash(embedding_content),
+            content_hash=content_hash,
             file_id=file_id,
             chunk_id=chunk_id,
             parent_heading_chunk_id=parent_id
         )
     
     def _build_embedding_content(self, content: str, frontmatter: Dict, 
-                                heading_path: List[str]) -> str:
-        """Build embedding content with context"""
+                                heading_path: List[str]) -> Tuple[str, str]:
+        """Build embedding content with context, returned with its get_hash digest"""
         context_parts = []
         
         # Add frontmatter context
@@ -213,7 +261,15 @@ class SmartChunker:
         # Add actual content
         context_parts.append(content)
         
-        return " | ".join(filter(None, context_parts))
+        # Hash each part as it is joined, giving the same digest as get_hash(embedding_content)
+        parts = [part for part in context_parts if part]
+        hasher = new_content_hasher()
+        for i, part in enumerate(parts):
+            if i:
+                hasher.update(b" | ")
+            hasher.update(part.encode('utf-8'))
+        
+        return " | ".join(parts), hasher.hexdigest()
     
     def _extract_frontmatter_context(self, frontmatter: Dict) -> List[str]:
         """Extract relevant context from frontmatter"""
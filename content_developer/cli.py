@@ -0,0 +1,639 @@
+"""
+AI Content Developer - Command Line Interface
+
+A tool for analyzing repositories and generating documentation based on support materials.
+"""
+import argparse
+import sys
+from functools import lru_cache
+from pathlib import Path
+import os
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+from . import __version__
+from .constants import AZURE_ENV_VARS, MAX_PHASES
+
+# Phase option strings derived from MAX_PHASES, computed once at import
+_DEFAULT_PHASES = str(MAX_PHASES)
+_PHASES_HELP = f'Phases to execute (e.g., "1", "1-2", "3"). Default: "{MAX_PHASES}"'
+_PHASES_ERROR = f"--phases must be a number between 1 and {MAX_PHASES}, or 'all'"
+_VALID_PHASES = frozenset({"all", *(str(phase) for phase in range(1, MAX_PHASES + 1))})
+
+# Shown when a github.com repo is used without GITHUB_TOKEN; written in one call
+_GITHUB_TOKEN_NOTICE = (
+    "ℹ️  No GitHub token configured. Only public repositories will be accessible.\n"
+    "   For private repositories, add GITHUB_TOKEN to your .env file.\n"
+    "   See README.md for instructions on creating a token.\n\n"
+)
+
+# Heavy modules (Azure/OpenAI clients, rich, document parsers) are imported
+# inside the functions that need them so --help and argument errors stay fast
+if TYPE_CHECKING:
+    from .models import Config
+
+# Help text for each option, keyed by dest; shared by every parser instance
+_HELP = {
+    "repo_url": "Repository URL to analyze (e.g., https://github.com/user/repo)",
+    "content_goal": "Goal for content creation/update (e.g., 'Create networking guide')",
+    "service_area": "Target Azure service area (e.g., 'Azure Kubernetes Service', 'AKS')",
+    "materials": "Support materials: files, URLs, or raw text (e.g., file.pdf, https://example.com, or 'your raw text')",
+    "content_limit": "Maximum characters to extract from each material (default: 15000)",
+    "audience": "Target audience description (default: 'technical professionals')",
+    "audience_level": "Technical expertise level of the target audience (default: intermediate)",
+    "phases": _PHASES_HELP,
+    "auto_confirm": "Skip all confirmation prompts (useful for automation)",
+    "apply_changes": "Apply generated changes to the repository",
+    "skip_toc": "Skip updating the table of contents (toc.yml)",
+    "no_material_check": "Skip material sufficiency check before content generation",
+    "multi_agent": "Use the multi-agent Azure AI Foundry system (requires Azure AI configuration)",
+    "max_concurrency": "Maximum content decisions generated at once in Phase 3 (default: 4)",
+    "max_requests_per_minute": "Limit LLM requests per minute to stay under the deployment's quota (default: 0, unlimited)",
+    "max_tokens_per_minute": "Limit estimated LLM tokens per minute (prompt plus expected completion) to stay under the deployment's quota (default: 0, unlimited)",
+    "work_dir": "Working directory for cloned repository (default: ./work/tmp)",
+    "max_depth": "Maximum repository depth to analyze (default: 3)",
+    "clean": "Remove ./llm_outputs and the work directory before running; on its own, clean up and exit",
+    "verbose": "Show detailed console output (INFO level logging)",
+    "debug_similarity": "Show detailed similarity scoring for content matching",
+}
+
+
+# Option table: (dest, flags, add_argument options); help text comes from _HELP
+_ARGUMENTS = (
+    # Required
+    ("repo_url", ("--repo",), {"required": True}),
+    ("content_goal", ("--goal",), {"required": True}),
+    ("service_area", ("--service",), {"required": True}),
+    ("materials", ("-m", "--materials"), {"nargs": "+", "required": True}),
+    # Materials
+    ("content_limit", ("--content-limit",), {"type": int, "default": 15000}),
+    # Audience
+    ("audience", ("--audience",), {"default": "technical professionals"}),
+    ("audience_level", ("--audience-level",), {
+        "default": "intermediate",
+        "choices": ["beginner", "intermediate", "advanced"],
+    }),
+    # Workflow control
+    ("phases", ("--phases", "-p"), {"type": str, "default": _DEFAULT_PHASES}),
+    ("auto_confirm", ("--auto-confirm", "-y"), {"action": "store_true"}),
+    ("apply_changes", ("--apply-changes", "-a"), {"action": "store_true"}),
+    ("skip_toc", ("--skip-toc",), {"action": "store_true"}),
+    ("no_material_check", ("--no-material-check",), {"action": "store_true"}),
+    ("multi_agent", ("--multi-agent",), {"action": "store_true"}),  # Only if the module is present
+    ("max_concurrency", ("--max-concurrency",), {"type": int, "default": 4}),
+    ("max_requests_per_minute", ("--max-requests-per-minute",), {"type": int, "default": 0}),
+    ("max_tokens_per_minute", ("--max-tokens-per-minute",), {"type": int, "default": 0}),
+    # Output
+    ("work_dir", ("--work-dir",), {"type": str, "default": None}),
+    ("max_depth", ("--max-depth",), {"type": int, "default": 3}),
+    ("clean", ("--clean",), {"action": "store_true"}),
+    # Debugging
+    ("verbose", ("--verbose", "-v"), {"action": "store_true"}),
+    ("debug_similarity", ("--debug-similarity",), {"action": "store_true"}),
+)
+
+
+@lru_cache(maxsize=None)
+def _multi_agent_available() -> bool:
+    """Check for the optional multi-agent module without importing it"""
+    from importlib.util import find_spec
+    
+    return find_spec("multi_agent_content_developer") is not None
+
+
+_USAGE_EXAMPLES = """
+Examples:
+  # Basic usage with materials
+  python main.py --repo https://github.com/user/repo --goal "Create CNI docs" \\
+    --service "Azure Kubernetes Service" -m material1.pdf material2.md
+  
+  # Using raw text as material
+  python main.py --repo https://github.com/user/repo --goal "Create docs" \\
+    --service "AKS" -m "Azure CNI enables native Azure networking for pods"
+  
+  # Mixing files, URLs, and raw text
+  python main.py --repo https://github.com/user/repo --goal "Update guide" \\
+    --service "AKS" -m guide.pdf https://docs.azure.com/aks "Additional context here"
+  
+  # Clean previous runs and start fresh
+  python main.py --repo https://github.com/user/repo --goal "Create tutorial" \\
+    --service "AKS" --clean -m tutorial.md
+  
+  # Run with specific audience
+  python main.py --repo https://github.com/user/repo --goal "Create networking guide" \\
+    --service "AKS" --audience "DevOps engineers" --audience-level advanced \\
+    -m material.pdf
+  
+  # Run for beginners
+  python main.py --repo https://github.com/user/repo --goal "Create tutorial" \\
+    --service "AKS" --audience "developers new to Kubernetes" \\
+    --audience-level beginner -m tutorial.md
+  
+  # Run phases 1-3 only (analysis, strategy, generation)
+  python main.py --repo https://github.com/user/repo --goal "Update networking guides" \\
+    --service "AKS" --phases 3 -m material.docx
+  
+  # Auto-confirm selections and apply changes
+  python main.py --repo https://github.com/user/repo --goal "Create tutorials" \\
+    --service "AKS" --auto-confirm --apply-changes -m tutorial.md
+  
+  # Run all phases (1-5) and apply generated content
+  python main.py --repo https://github.com/user/repo --goal "Update docs" \\
+    --service "AKS" --apply-changes -m guide.pdf
+"""
+
+_ENVIRONMENT_HELP = """
+Environment Variables:
+  AZURE_OPENAI_ENDPOINT              - Azure OpenAI endpoint URL
+  AZURE_OPENAI_COMPLETION_DEPLOYMENT - Deployment name for completion model
+  AZURE_OPENAI_EMBEDDING_DEPLOYMENT  - Deployment name for embedding model
+  AZURE_OPENAI_TEMPERATURE          - Temperature for completions (default: 0.3)
+"""
+
+_EPILOG = _USAGE_EXAMPLES + _ENVIRONMENT_HELP
+
+
+def _fast_kind(options: dict) -> str:
+    """Classify an _ARGUMENTS entry for the fast argv walker"""
+    if options.get("action") == "store_true":
+        return "flag"
+    if options.get("nargs") == "+":
+        return "list"
+    if "choices" in options:
+        return "choice"
+    if options.get("type") is int:
+        return "int"
+    return "str"
+
+
+# Fast argv walker tables, derived from _ARGUMENTS so each option is defined once.
+# _FAST_OPTIONS maps flag -> (dest, kind); kinds are "str", "int", "choice",
+# "list" (nargs="+") and "flag" (store_true).
+_FAST_OPTIONS = {
+    flag: (dest, _fast_kind(options))
+    for dest, flags, options in _ARGUMENTS
+    for flag in flags
+}
+_FAST_CHOICES = {dest: frozenset(options["choices"]) for dest, _, options in _ARGUMENTS if "choices" in options}
+_REQUIRED_DESTS = tuple(dest for dest, _, options in _ARGUMENTS if options.get("required"))
+
+
+def _fast_defaults() -> dict:
+    """Defaults matching the argparse definitions in _ARGUMENTS"""
+    return {
+        dest: options.get("default", False if options.get("action") == "store_true" else None)
+        for dest, _, options in _ARGUMENTS
+    }
+
+
+def _parse_argv(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse well-formed command lines without building the argparse parser
+    
+    Returns None for anything outside the simple case (help, unknown or
+    abbreviated options, --opt=value, missing values or required options,
+    bad int/choice values) so argparse can parse it and report errors.
+    """
+    values = _fast_defaults()
+    i, n = 1, len(argv)
+    
+    while i < n:
+        spec = _FAST_OPTIONS.get(argv[i])
+        if spec is None:
+            return None
+        dest, kind = spec
+        i += 1
+        
+        if kind == "flag":
+            if dest == "multi_agent" and not _multi_agent_available():
+                return None
+            values[dest] = True
+            continue
+        
+        if kind == "list":
+            start = i
+            while i < n and not argv[i].startswith("-"):
+                i += 1
+            if i == start:
+                return None
+            values[dest] = argv[start:i]
+            continue
+        
+        if i >= n or argv[i].startswith("-"):
+            return None
+        value = argv[i]
+        i += 1
+        
+        if kind == "int":
+            try:
+                value = int(value)
+            except ValueError:
+                return None
+        elif kind == "choice" and value not in _FAST_CHOICES[dest]:
+            return None
+        values[dest] = value
+    
+    if any(values[dest] is None for dest in _REQUIRED_DESTS):
+        return None
+    return SimpleNamespace(**values)
+
+
+def _fast_rmtree(directory: str):
+    """Remove a directory tree with the platform's native tool, falling back to shutil"""
+    import subprocess
+    
+    if os.name == "nt":
+        command = ["cmd", "/c", "rd", "/s", "/q", directory]
+    else:
+        command = ["rm", "-rf", "--", directory]
+    
+    try:
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        import shutil
+        
+        # ignore_errors skips the per-entry onerror handling; the caller checks the result
+        try:
+            shutil.rmtree(os.fspath(directory), ignore_errors=True)
+        except RecursionError:
+            _walk_rmtree(directory)
+
+
+def _walk_rmtree(directory: str):
+    """Remove a directory tree bottom-up with os.walk, for trees too deep for rmtree"""
+    for root, dirs, files in os.walk(directory, topdown=False):
+        for name in files:
+            try:
+                os.unlink(os.path.join(root, name))
+            except OSError:
+                pass
+        for name in dirs:
+            path = os.path.join(root, name)
+            try:
+                if os.path.islink(path):
+                    os.unlink(path)
+                else:
+                    os.rmdir(path)
+            except OSError:
+                pass
+    try:
+        os.rmdir(directory)
+    except OSError:
+        pass
+
+
+def _split_tree(directory: str) -> List[str]:
+    """Unlink a directory's top-level files and return its immediate subdirectories
+    
+    Symlinks to directories are unlinked like files, never descended into.
+    The caller must check that the directory itself is not a symlink.
+    """
+    subtrees = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subtrees.append(entry.path)
+            else:
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+    return subtrees
+
+
+def _rmtree_safe(directory: str) -> Tuple[str, Optional[OSError]]:
+    """Remove a directory tree, returning the directory and the error that kept it, if any"""
+    try:
+        # Usually empty by now: its subtrees were removed in parallel
+        os.rmdir(directory)
+    except OSError:
+        _fast_rmtree(directory)
+    if not os.path.lexists(directory):
+        return directory, None
+    
+    # Something was left behind; a strict pass over the remainder reports why
+    import shutil
+    
+    try:
+        shutil.rmtree(directory)
+    except OSError as e:
+        return directory, e
+    return directory, None
+
+
+def perform_cleanup(work_dir: Union[str, Path]):
+    """Clean up llm_outputs and work directory"""
+    import errno
+    import stat
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from .utils.logging_config import get_console
+    
+    console = get_console()
+    console.print("  ℹ Cleaning up directories...", style="blue")
+    
+    # Directories to clean, normalized to str once for scandir, rm and messages
+    directories_to_clean = [
+        "./llm_outputs",
+        os.fspath(work_dir)
+    ]
+    
+    # Remove the independent subtrees (embeddings/, cache/, the clone, ...)
+    # concurrently so their unlink syscalls overlap, then drop the roots.
+    # Outcome per root, in the order above: None once removed, else the error
+    results = {}
+    existing = []
+    subtrees = []
+    for directory in directories_to_clean:
+        # lstat, not stat: a symlinked root is never followed into its target
+        try:
+            mode = os.lstat(directory).st_mode
+        except FileNotFoundError:
+            console.print(f"  ℹ Directory not found: {directory}", style="blue")
+            continue
+        except OSError as e:
+            results[directory] = e
+            continue
+        
+        if stat.S_ISLNK(mode):
+            results[directory] = OSError("Cannot clean a symbolic link; its target is left untouched")
+            continue
+        if not stat.S_ISDIR(mode):
+            # A regular file (or anything else) is reported, never handed to rm -rf
+            results[directory] = NotADirectoryError(errno.ENOTDIR, os.strerror(errno.ENOTDIR), directory)
+            continue
+        
+        try:
+            subtrees.extend(_split_tree(directory))
+        except OSError:
+            pass  # Unreadable directory; _rmtree_safe reports what remains
+        results[directory] = None
+        existing.append(directory)
+    
+    if subtrees:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            for future in as_completed([executor.submit(_fast_rmtree, path) for path in subtrees]):
+                future.result()
+    
+    results.update(map(_rmtree_safe, existing))
+    for directory, error in results.items():
+        if error is None:
+            console.print(f"  ✓ Removed: {directory}", style="green")
+        else:
+            console.print(f"  ⚠ Warning: failed to remove {directory}: {error}", style="bold red")
+    
+    console.print("  ✓ Cleanup complete", style="green")
+    console.print("─" * min(80, console.width), style="dim")
+    console.print()
+
+
+def _sniff_mode(argv: List[str]) -> str:
+    """Classify the invocation as "version", "clean" or "full" before parsing"""
+    args = argv[1:]
+    if args == ['--version']:
+        return "version"
+    
+    # Clean-only: nothing but --clean and an optional --work-dir value
+    if '--clean' in args:
+        i = 0
+        while i < len(args):
+            if args[i] == '--work-dir':
+                i += 2
+            elif args[i] == '--clean' or args[i].startswith('--work-dir='):
+                i += 1
+            else:
+                return "full"
+        return "clean"
+    return "full"
+
+
+def main():
+    """Main entry point"""
+    mode = _sniff_mode(sys.argv)
+    
+    # Answer --version without building the parser or importing the stack
+    if mode == "version":
+        sys.stdout.write(f"{os.path.basename(sys.argv[0])} {__version__}\n")
+        sys.exit(0)
+    
+    # --clean on its own (optionally with --work-dir) only cleans up
+    if mode == "clean":
+        clean_parser = argparse.ArgumentParser(description="Remove ./llm_outputs and the work directory")
+        clean_parser.add_argument("--clean", action="store_true")
+        clean_parser.add_argument("--work-dir", default=None)
+        clean_args = clean_parser.parse_args()
+        perform_cleanup(clean_args.work_dir or os.path.join(os.getcwd(), "work", "tmp"))
+        sys.exit(0)
+    
+    # Walk sys.argv directly; argparse handles --help (from _ARGUMENTS and _HELP)
+    # and malformed input
+    parser = None
+    args = _parse_argv(sys.argv)
+    if args is None:
+        parser = create_argument_parser()
+        args = parser.parse_args()
+    
+    # Resolve the default work directory only when --work-dir was not given
+    if args.work_dir is None:
+        args.work_dir = os.path.join(os.getcwd(), "work", "tmp")
+    
+    # Handle cleanup if requested
+    if args.clean:
+        perform_cleanup(args.work_dir)
+    
+    # Validate arguments
+    validate_arguments(parser, args)
+    
+    # Create configuration
+    config = create_config_from_args(args)
+    
+    # Execute workflow; logging and the console display are set up there
+    execute_workflow(config, verbose=args.verbose)
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """Create and configure argument parser"""
+    parser = argparse.ArgumentParser(
+        description="AI Content Developer - Generate documentation from support materials",
+        # The default formatter reflows the epilog into one paragraph, which
+        # mangles the multi-line examples; keep the raw layout
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
+    )
+    
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {__version__}"
+    )
+    
+    add_arguments(parser)
+    
+    return parser
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """Add all arguments to parser; --help lists them in table order"""
+    for dest, flags, options in _ARGUMENTS:
+        if dest == "multi_agent" and not _multi_agent_available():
+            continue
+        parser.add_argument(*flags, dest=dest, help=_HELP[dest], **options)
+
+
+def _argument_error(parser: Optional[argparse.ArgumentParser], message: str):
+    """Report a usage error, building the parser only if the fast path skipped it"""
+    (parser or create_argument_parser()).error(message)
+
+
+def validate_arguments(parser: Optional[argparse.ArgumentParser], args: argparse.Namespace):
+    """Validate parsed arguments, cheapest and most common failures first"""
+    from dotenv import load_dotenv
+    
+    # Check Azure OpenAI configuration (.env included, as Config would load it)
+    load_dotenv()
+    environ = os.environ
+    args.azure_env = {name: environ[name] for name in AZURE_ENV_VARS if name in environ}
+    if not args.azure_env.get("AZURE_OPENAI_ENDPOINT"):
+        _argument_error(parser, "AZURE_OPENAI_ENDPOINT environment variable not set. See --help for details.")
+    
+    # Validate phases
+    if args.phases not in _VALID_PHASES:
+        _argument_error(parser, _PHASES_ERROR)
+    
+    # Validate concurrency
+    if args.max_concurrency < 1:
+        _argument_error(parser, "--max-concurrency must be at least 1")
+    if args.max_requests_per_minute < 0 or args.max_tokens_per_minute < 0:
+        _argument_error(parser, "--max-requests-per-minute and --max-tokens-per-minute cannot be negative")
+    
+    # Validate repository URL
+    if not is_valid_url(args.repo_url):
+        _argument_error(parser, f"Invalid repository URL: {args.repo_url}")
+    
+    # Validate work directory (a stat is enough on re-runs)
+    work_dir = os.fspath(args.work_dir)
+    if not os.path.isdir(work_dir):
+        try:
+            os.makedirs(work_dir, exist_ok=True)
+        except OSError as e:
+            _argument_error(parser, f"Cannot create work directory {work_dir}: {e}")
+    
+    # Validate materials - allow raw text, files, or URLs
+    for material in args.materials:
+        # If it's not a URL and not an existing file, treat it as raw text
+        if not is_valid_url(material) and not os.path.exists(material):
+            # Will be treated as raw text input by ContentExtractor
+            pass
+    
+    # Check if accessing GitHub without token (informational only)
+    github_token = environ.get("GITHUB_TOKEN")
+    if 'github.com' in args.repo_url and not github_token:
+        sys.stdout.write(_GITHUB_TOKEN_NOTICE)
+
+
+@lru_cache(maxsize=256)
+def is_valid_url(url: str) -> bool:
+    """Check if string is a valid URL"""
+    # Raw-text materials never contain a scheme separator; skip urlsplit for them
+    if "://" not in url:
+        return False
+    
+    from urllib.parse import urlsplit
+    
+    try:
+        result = urlsplit(url)
+        return bool(result.scheme and result.netloc)
+    except ValueError:
+        return False
+
+
+def create_config_from_args(args: argparse.Namespace) -> "Config":
+    """Create Config object from parsed arguments"""
+    from .models import Config
+    
+    return Config(
+        repo_url=args.repo_url,
+        content_goal=args.content_goal,
+        service_area=args.service_area,
+        audience=args.audience,
+        audience_level=args.audience_level,
+        support_materials=args.materials,
+        auto_confirm=args.auto_confirm,
+        work_dir=Path(args.work_dir),
+        max_repo_depth=args.max_depth,
+        content_limit=args.content_limit,
+        phases=args.phases,
+        debug_similarity=args.debug_similarity,
+        apply_changes=args.apply_changes,
+        skip_toc=args.skip_toc,
+        check_material_sufficiency=not args.no_material_check,
+        multi_agent=getattr(args, 'multi_agent', False),
+        max_concurrency=args.max_concurrency,
+        max_requests_per_minute=args.max_requests_per_minute,
+        max_tokens_per_minute=args.max_tokens_per_minute,
+        azure_env=args.azure_env
+    )
+
+
+def execute_workflow(config: "Config", verbose: bool = False):
+    """Execute the content development workflow"""
+    from .utils.logging_config import setup_dual_logging, get_console
+    from .display.console_display import ConsoleDisplay
+    from .orchestrator import ContentDeveloperOrchestrator
+    from .display import display_results
+    
+    # Set up dual logging only once a workflow is actually going to run
+    # Use INFO level for console if verbose, otherwise WARNING
+    setup_dual_logging(console_level="INFO" if verbose else "WARNING")
+    
+    # Create console display
+    console_display = ConsoleDisplay(get_console())
+    
+    try:
+        # Check if multi-agent mode is requested
+        if config.multi_agent:
+            console_display.show_header(f"{config.repo_name} (Multi-Agent)", config.content_goal, config.service_area)
+            console_display.show_status("Using Azure AI Foundry multi-agent system", "info")
+            
+            # Use multi-agent system (imported only when requested)
+            from multi_agent_content_developer import MultiAgentContentDeveloper
+            developer = MultiAgentContentDeveloper(config)
+            try:
+                result = developer.process_documentation_request()
+                
+                # Display results
+                if result.success:
+                    console_display.show_status(result.message, "success")
+                else:
+                    console_display.show_error(result.message, "Workflow Failed")
+                    
+            finally:
+                # Clean up agents
+                developer.cleanup()
+        else:
+            # Use traditional orchestrator
+            console_display.show_header(config.repo_name, config.content_goal, config.service_area)
+            
+            # Initialize orchestrator
+            orchestrator = ContentDeveloperOrchestrator(config, console_display)
+            
+            # Execute workflow
+            result = orchestrator.execute()
+            
+            # Display results
+            if result.success:
+                display_results(result)
+            else:
+                console_display.show_error(result.message, "Workflow Failed")
+        
+        return result.success
+        
+    except KeyboardInterrupt:
+        raise  # Re-raise to be handled by main
+    except Exception as e:
+        console_display.show_error(str(e), "Workflow Error")
+        import logging
+        logging.exception("Workflow execution failed")
+        return False
+
+
+if __name__ == "__main__":
+    main() 
\ No newline at end of file
@@ -8,4 +8,16 @@ MAX_PHASES = 5
 # Default models (used when environment variables are not set)
 # These are overridden by Azure deployment environment variables
 DEFAULT_COMPLETION_MODEL = "gpt-4"           # Default for all operations
-DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"  # For embeddings 
\ No newline at end of file
+DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"  # For embeddings 
+# Azure OpenAI environment variables read into Config.azure_env
+AZURE_ENV_VARS = (
+    "AZURE_OPENAI_ENDPOINT",
+    "AZURE_OPENAI_API_VERSION",
+    "AZURE_OPENAI_COMPLETION_DEPLOYMENT",
+    "AZURE_OPENAI_EMBEDDING_DEPLOYMENT",
+    "AZURE_OPENAI_TEMPERATURE",
+    "AZURE_OPENAI_CREATIVE_TEMPERATURE",
+)
+
+# Markdown frontmatter must close within this many characters of the file start
+FRONTMATTER_SCAN_LIMIT = 16384
@@ -1,6 +1,10 @@
 """
 Results display utilities
 """
+import io
+import sys
+from collections import Counter
+from contextlib import redirect_stdout
 from pathlib import Path
 from typing import Dict, List
 
@@ -8,7 +12,23 @@ from ..models import Result
 
 
 def display_results(result: Result):
-    """Display final results"""
+    """Display final results
+    
+    The report is assembled in memory and written to stdout in one call
+    instead of one write per print.
+    """
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            _display_report(result)
+    finally:
+        # Write whatever was rendered, even if a section failed
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
+def _display_report(result: Result):
+    """Print every section of the results report"""
     _print_header()
     _display_basic_info(result)
     _display_materials(result)
@@ -71,9 +91,10 @@ def _display_phase_status(result: Result):
 
 def _display_strategy_summary(strategy):
     """Display content strategy summary"""
-    create_count = sum(1 for decision in strategy.decisions if decision.action == 'CREATE')
-    update_count = sum(1 for decision in strategy.decisions if decision.action == 'UPDATE')
-    skip_count = sum(1 for decision in strategy.decisions if decision.action == 'SKIP')
+    action_counts = Counter(decision.action for decision in strategy.decisions)
+    create_count = action_counts['CREATE']
+    update_count = action_counts['UPDATE']
+    skip_count = action_counts['SKIP']
     
     print(f"\n📋 Content Strategy:")
     print(f"   Total Decisions: {len(strategy.decisions)}")
@@ -2,7 +2,7 @@
 Content extraction from various sources
 """
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 import logging
 
 from ..utils import read, error_handler, get_import
@@ -11,6 +11,29 @@ from ..utils.imports import HAS_DOCX, HAS_PDF, HAS_WEB
 logger = logging.getLogger(__name__)
 
 
+def join_limited(parts: Iterable[str], limit: int, sep: str = '\n') -> str:
+    """Join parts lazily, stopping once the result reaches limit characters
+    
+    Args:
+        parts: Iterable (typically a generator) of text pieces
+        limit: Maximum length of the returned string
+        sep: Separator placed between pieces
+        
+    Returns:
+        sep.join(parts)[:limit], without consuming parts past the limit
+    """
+    collected = []
+    size = 0
+    for part in parts:
+        if collected:
+            size += len(sep)
+        collected.append(part)
+        size += len(part)
+        if size >= limit:
+            break
+    return sep.join(collected)[:limit]
+
+
 class ContentExtractor:
     """Extract content from various file types and URLs"""
     
@@ -109,14 +132,22 @@ class ContentExtractor:
                 logger.error(f"Failed to open DOCX file {path.name}: {e}")
                 return None
             
-        parts = [paragraph.text.strip() for paragraph in doc.paragraphs if paragraph.text.strip()]
+        return join_limited(self._iter_docx_text(doc), self.config.content_limit)
+    
+    def _iter_docx_text(self, doc) -> Iterable[str]:
+        """Yield non-empty paragraph text, then table cell text"""
+        for paragraph in doc.paragraphs:
+            text = paragraph.text.strip()
+            if text:
+                yield text
         
         # Extract table content
         for table in doc.tables:
             for row in table.rows:
-                parts.extend(cell.text.strip() for cell in row.cells if cell.text.strip())
-        
-        return '\n'.join(parts)[:self.config.content_limit]
+                for cell in row.cells:
+                    text = cell.text.strip()
+                    if text:
+                        yield text
     
     def _extract_pdf(self, path: Path) -> Optional[str]:
         """Extract text from PDF file"""
@@ -134,19 +165,10 @@ class ContentExtractor:
     def _read_pdf_content(self, file_handle, PdfReader) -> str:
         """Read content from PDF file handle"""
         reader = PdfReader(file_handle)
-        content = ""
         
-        # Extract from first 10 pages
-        for page in reader.pages[:10]:
-            text = page.extract_text()
-            if not text:
-                continue
-                
-            content += text + '\n'
-            if len(content) > self.config.content_limit:
-                break
-        
-        return content[:self.config.content_limit]
+        # Extract from first 10 pages, stopping once the limit is reached
+        pages = (text + '\n' for page in reader.pages[:10] if (text := page.extract_text()))
+        return join_limited(pages, self.config.content_limit, sep='')
     
     def _extract_url(self, source: str) -> Optional[str]:
         """Extract content from URL"""
@@ -193,11 +215,5 @@ class ContentExtractor:
             element.decompose()
         
         # Extract text lines
-        lines = []
-        for line in soup.get_text().splitlines():
-            stripped = line.strip()
-            if stripped:
-                lines.append(stripped)
-        
-        text = '\n'.join(lines)
-        return text[:self.config.content_limit]
+        lines = (stripped for line in soup.get_text().splitlines() if (stripped := line.strip()))
+        return join_limited(lines, self.config.content_limit)
@@ -2,6 +2,7 @@
 Main content generator orchestrator for Phase 3
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Callable
 
@@ -9,7 +10,7 @@ from ..models import ContentStrategy, DocumentChunk, ContentDecision
 from ..processors.smart_processor import SmartProcessor
 from ..processors import ContentDiscoveryProcessor
 from ..processors.generation import ContentGenerationProcessor
-from ..utils import write, mkdir, read
+from ..utils import write, read
 from ..utils.step_tracker import get_step_tracker
 
 logger = logging.getLogger(__name__)
@@ -48,76 +49,96 @@ class ContentGenerator(SmartProcessor):
         if hasattr(self, 'current_phase') and self.current_phase:
             generation_processor.set_phase_step(self.current_phase, 1)
         
-        # Process each decision
-        for i, decision in enumerate(strategy.decisions, 1):
-            logger.info(f"Processing decision {i}/{len(strategy.decisions)}: "
-                       f"{decision.action} - {getattr(decision, 'filename', getattr(decision, 'target_file', 'N/A'))}")
+        # Generation is bound by LLM latency, so up to config.max_concurrency decisions
+        # run at once; results are handled below in decision order
+        decisions = strategy.decisions
+        max_workers = max(1, min(self.config.max_concurrency, len(decisions)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._process_decision, generation_processor, i, len(decisions),
+                                decision, materials, chunks, repo_name, working_directory)
+                for i, decision in enumerate(decisions, 1)
+            ]
             
-            # Update progress if callback provided
-            if self.progress_callback:
-                action_name = getattr(decision, 'file_title', getattr(decision, 'filename', f"Decision {i}"))
-                self.progress_callback(action_name)
-            
-            # Process the decision
-            content, metadata = generation_processor.process(
-                decision, materials, chunks, self.config, repo_name, working_directory
-            )
-            
-            # Handle results based on action type and status
-            if decision.action == "SKIP" or metadata.get('status') == 'skipped_insufficient_materials':
-                results['skip_results'].append(metadata)
-            elif decision.action == "CREATE":
-                # Save preview file for CREATE
-                preview_path = None
-                if content:
-                    preview_dir = Path("./llm_outputs/preview/create")
-                    mkdir(preview_dir)
-                    filename = decision.target_file  # Now guaranteed to be non-null
-                    preview_path = preview_dir / Path(filename).name
-                    write(preview_path, content)
-                    preview_path = str(preview_path)
-                    if self.console_display:
-                        self.console_display.show_status(f"Writing to preview: create/{Path(filename).name}", "info")
-                
-                result = {
-                    'action': decision,
-                    'content': content,
-                    'success': content is not None,
-                    'preview_path': preview_path,
-                    **metadata
-                }
-                results['create_results'].append(result)
-                if result['success']:
-                    results['created_files'].append(decision.target_file)
-            elif decision.action == "UPDATE":
-                # Save preview file for UPDATE
-                preview_path = None
-                if content:
-                    preview_dir = Path("./llm_outputs/preview/update")
-                    mkdir(preview_dir)
-                    filename = decision.target_file  # Now guaranteed to be non-null
-                    preview_path = preview_dir / Path(filename).name
-                    write(preview_path, content)
-                    preview_path = str(preview_path)
-                    if self.console_display:
-                        self.console_display.show_status(f"Writing to preview: update/{Path(filename).name}", "info")
-                
-                result = {
-                    'action': decision,
-                    'updated_content': content,
-                    'success': content is not None,
-                    'preview_path': preview_path,
-                    **metadata
-                }
-                results['update_results'].append(result)
-                if result['success']:
-                    results['updated_files'].append(decision.target_file)
+            try:
+                for i, (decision, future) in enumerate(zip(decisions, futures), 1):
+                    content, metadata = future.result()
+                    
+                    # Update progress if callback provided
+                    if self.progress_callback:
+                        action_name = getattr(decision, 'file_title', getattr(decision, 'filename', f"Decision {i}"))
+                        self.progress_callback(action_name)
+                    
+                    # Handle results based on action type and status
+                    if decision.action == "SKIP" or metadata.get('status') == 'skipped_insufficient_materials':
+                        results['skip_results'].append(metadata)
+                    elif decision.action == "CREATE":
+                        # Save preview file for CREATE
+                        preview_path = None
+                        if content:
+                            preview_dir = self.config.ensure_dir("preview/create")
+                            filename = decision.target_file  # Now guaranteed to be non-null
+                            preview_path = preview_dir / Path(filename).name
+                            write(preview_path, content)
+                            preview_path = str(preview_path)
+                            if self.console_display:
+                                self.console_display.show_status(f"Writing to preview: create/{Path(filename).name}", "info")
+                        
+                        result = {
+                            'action': decision,
+                            'content': content,
+                            'success': content is not None,
+                            'preview_path': preview_path,
+                            **metadata
+                        }
+                        results['create_results'].append(result)
+                        if result['success']:
+                            results['created_files'].append(decision.target_file)
+                    elif decision.action == "UPDATE":
+                        # Save preview file for UPDATE
+                        preview_path = None
+                        if content:
+                            preview_dir = self.config.ensure_dir("preview/update")
+                            filename = decision.target_file  # Now guaranteed to be non-null
+                            preview_path = preview_dir / Path(filename).name
+                            write(preview_path, content)
+                            preview_path = str(preview_path)
+                            if self.console_display:
+                                self.console_display.show_status(f"Writing to preview: update/{Path(filename).name}", "info")
+                        
+                        result = {
+                            'action': decision,
+                            'updated_content': content,
+                            'success': content is not None,
+                            'preview_path': preview_path,
+                            **metadata
+                        }
+                        results['update_results'].append(result)
+                        if result['success']:
+                            results['updated_files'].append(decision.target_file)
+            except BaseException:
+                # On an error or Ctrl-C, do not start the decisions still queued, each
+                # several LLM calls (as shutdown(cancel_futures=True) would on Python 3.9+)
+                for future in futures:
+                    future.cancel()
+                raise
         
         # Add summary
         results['summary'] = self._create_summary(results)
         
         return results
     
+    def _process_decision(self, generation_processor: ContentGenerationProcessor, index: int, 
+                          total: int, decision: ContentDecision, materials: List[Dict], 
+                          chunks: List[DocumentChunk], repo_name: str, working_directory: str):
+        """Generate content for a single decision (runs on a worker thread)"""
+        logger.info(f"Processing decision {index}/{total}: "
+                   f"{decision.action} - {getattr(decision, 'filename', getattr(decision, 'target_file', 'N/A'))}")
+        
+        return generation_processor.process(
+            decision, materials, chunks, self.config, repo_name, working_directory
+        )
+    
     def _load_existing_chunks(self, working_dir_path: Path, repo_name: str, 
                              working_directory: str) -> List[DocumentChunk]:
         """Load existing chunks from the working directory"""
@@ -1,6 +1,7 @@
 """
 Directory confirmation using LLM-native approach
 """
+import heapq
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -374,7 +375,7 @@ class DirectoryConfirmation(GenericInteractive):
             try:
                 # List immediate subdirectories
                 subdirs = [d for d in path_obj.iterdir() if d.is_dir() and not d.name.startswith('.')]
-                for subdir in sorted(subdirs)[:5]:  # Show first 5 subdirs
+                for subdir in heapq.nsmallest(5, subdirs):  # Show first 5 subdirs
                     structure_lines.append(f"  ├── {subdir.name}/")
                 
                 if len(subdirs) > 5:
@@ -3,8 +3,9 @@ Configuration model for AI Content Developer
 """
 import os
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 import logging
 
 # Load environment variables from .env file if it exists
@@ -12,7 +13,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from ..utils import mkdir
-from ..constants import DEFAULT_COMPLETION_MODEL, DEFAULT_EMBEDDING_MODEL
+from ..constants import AZURE_ENV_VARS, DEFAULT_COMPLETION_MODEL, DEFAULT_EMBEDDING_MODEL
 
 logger = logging.getLogger(__name__)
 
@@ -41,11 +42,15 @@ class Config:
     skip_toc: bool = False
     check_material_sufficiency: bool = True
     multi_agent: bool = False  # Use multi-agent Azure AI Foundry system
+    max_concurrency: int = 4  # Phase 3 decisions generated at once
+    max_requests_per_minute: int = 0  # Chat completion request budget; 0 = unlimited
+    max_tokens_per_minute: int = 0  # Estimated chat completion token budget (prompt + completion); 0 = unlimited
     
     # GitHub configuration (optional)
     github_token: Optional[str] = None
     
     # Azure OpenAI configuration
+    azure_env: Dict[str, str] = field(default_factory=dict)  # Snapshot of AZURE_ENV_VARS that are set
     azure_endpoint: str = ""
     api_version: str = "2024-08-01-preview"
     
@@ -62,27 +67,37 @@ class Config:
     temperature: float = 0.3
     creative_temperature: float = 0.7
     
+    @cached_property
+    def repo_name(self) -> str:
+        """Repository name from the URL, without a trailing .git"""
+        name = self.repo_url.rsplit('/', 1)[-1]
+        return name[:-4] if name.endswith('.git') else name
+    
     def __post_init__(self):
         """Post-initialization setup"""
+        if not self.azure_env:
+            self.azure_env = {name: os.environ[name] for name in AZURE_ENV_VARS if name in os.environ}
         self._validate_azure_config()
         self._load_deployment_config()
         self._load_github_config()
-        self._create_output_directories()
     
     def _validate_azure_config(self):
         """Validate Azure OpenAI configuration"""
-        self.azure_endpoint = os.getenv("AZURE_OPENAI_ENDPOINT", "")
+        env = self.azure_env
+        self.azure_endpoint = env.get("AZURE_OPENAI_ENDPOINT", "")
         if not self.azure_endpoint:
             raise ValueError("AZURE_OPENAI_ENDPOINT environment variable not set")
         
         # API version can be overridden
-        self.api_version = os.getenv("AZURE_OPENAI_API_VERSION", self.api_version)
+        self.api_version = env.get("AZURE_OPENAI_API_VERSION", self.api_version)
     
     def _load_deployment_config(self):
         """Load deployment configuration from environment variables"""
+        env = self.azure_env
+        
         # Primary deployments
-        self.completion_deployment = os.getenv("AZURE_OPENAI_COMPLETION_DEPLOYMENT", "gpt-4")
-        self.embedding_deployment = os.getenv("AZURE_OPENAI_EMBEDDING_DEPLOYMENT", "text-embedding-3-small")
+        self.completion_deployment = env.get("AZURE_OPENAI_COMPLETION_DEPLOYMENT", "gpt-4")
+        self.embedding_deployment = env.get("AZURE_OPENAI_EMBEDDING_DEPLOYMENT", "text-embedding-3-small")
         
         # Set model names to deployment names for compatibility
         self.completion_model = self.completion_deployment
@@ -90,8 +105,8 @@ class Config:
         self.embedding_model = self.embedding_deployment
         
         # Temperature settings
-        self.temperature = float(os.getenv("AZURE_OPENAI_TEMPERATURE", "0.3"))
-        self.creative_temperature = float(os.getenv("AZURE_OPENAI_CREATIVE_TEMPERATURE", "0.7"))
+        self.temperature = float(env.get("AZURE_OPENAI_TEMPERATURE", "0.3"))
+        self.creative_temperature = float(env.get("AZURE_OPENAI_CREATIVE_TEMPERATURE", "0.7"))
     
     def _load_github_config(self):
         """Load optional GitHub configuration from environment"""
@@ -113,20 +128,12 @@ class Config:
         else:
             logger.info("No GitHub token configured - only public repositories accessible")
     
-    def _create_output_directories(self):
-        """Create all necessary output directories"""
-        base_dir = "./llm_outputs"
-        
-        # Define only required directories
-        required_directories = [
-            "embeddings",
-            "preview",
-            "preview/create",
-            "preview/update",
-            "preview/toc"
-        ]
+    def ensure_dir(self, subpath: str) -> Path:
+        """Create (if needed) and return a directory under ./llm_outputs
         
-        # Create each directory
-        for directory in required_directories:
-            full_path = f"{base_dir}/{directory}"
-            mkdir(full_path) 
\ No newline at end of file
+        Output directories are created at the point of first write rather
+        than up front, so a run only creates the directories it uses.
+        """
+        path = Path("./llm_outputs") / subpath
+        mkdir(path)
+        return path 
\ No newline at end of file
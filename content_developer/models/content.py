@@ -1,10 +1,14 @@
 """
 Content models for AI Content Developer
 """
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+# Slotted dataclass where supported (Python 3.10+): smaller instances, faster attribute access
+_slotted_dataclass = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
+
 
 @dataclass
 class ContentStrategy:
@@ -57,7 +61,7 @@ class ContentDecision:
             self.ms_topic = self.content_type
 
 
-@dataclass
+@_slotted_dataclass
 class DocumentChunk:
     """Represents a chunk of document content with metadata"""
     content: str
@@ -67,7 +71,7 @@ class DocumentChunk:
     chunk_index: int
     frontmatter: Dict[str, Any]
     embedding_content: str
-    embedding: Optional[List[float]] = None
+    embedding: Optional[List[float]] = None  # float32 ndarray when loaded from the cache
     content_hash: Optional[str] = None
     file_id: str = ""
     chunk_id: str = ""
@@ -2,14 +2,18 @@
 Change application logic for content development workflow.
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 
 from ..models import Result
 from ..utils import write, mkdir, read
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads writing generated files at once
+MAX_WRITE_WORKERS = 32
+
 
 class ChangeApplier:
     """Handles application of generated changes to the repository"""
@@ -34,9 +38,9 @@ class ChangeApplier:
         # Build remediated content map
         remediated_map = self._build_remediated_content_map(result)
         
-        # Apply changes in order
-        self._apply_create_files(result, remediated_map, working_dir_path)
-        self._apply_update_files(result, remediated_map, working_dir_path)
+        # Apply changes: CREATE/UPDATE files are written concurrently, then the TOC
+        writes = self._plan_file_writes(result, remediated_map, working_dir_path)
+        self._apply_file_writes(writes)
         self._apply_toc_changes(result, working_dir_path)
         
         # Finalize
@@ -70,73 +74,76 @@ class ChangeApplier:
         
         return remediated_content
     
-    def _apply_create_files(self, result: Result, remediated_map: Dict[str, str], 
-                           working_dir_path: Path) -> None:
-        """Apply CREATE file operations"""
-        create_results = result.generation_results.get('create_results', [])
-        
-        for create_result in create_results:
-            if create_result.get('success'):
-                self._apply_single_create(create_result, remediated_map, working_dir_path)
+    def _plan_file_writes(self, result: Result, remediated_map: Dict[str, str],
+                          working_dir_path: Path) -> List[Tuple[str, str, Path, str]]:
+        """Collect (operation, filename, target path, content) for CREATE then UPDATE results"""
+        writes = []
+        for operation, results_key in (("CREATE", 'create_results'), ("UPDATE", 'update_results')):
+            for file_result in result.generation_results.get(results_key, []):
+                if file_result.get('success'):
+                    if planned := self._plan_single_write(operation, file_result, remediated_map, working_dir_path):
+                        writes.append(planned)
+        return writes
     
-    def _apply_single_create(self, create_result: Dict, remediated_map: Dict[str, str],
-                            working_dir_path: Path) -> None:
-        """Apply a single CREATE operation"""
+    def _plan_single_write(self, operation: str, file_result: Dict, remediated_map: Dict[str, str],
+                           working_dir_path: Path) -> Optional[Tuple[str, str, Path, str]]:
+        """Resolve the target path and content of a single CREATE/UPDATE operation"""
+        target_filename = None
         try:
-            action = create_result.get('action')
+            action = file_result.get('action')
             if not action:
-                return
+                return None
             
             target_filename = action.target_file
-            content = self._get_content_for_file(target_filename, remediated_map, "create")
+            content = self._get_content_for_file(target_filename, remediated_map, operation.lower())
             
             if not content:
-                logger.warning(f"No content found for CREATE: {target_filename}")
-                return
+                logger.warning(f"No content found for {operation}: {target_filename}")
+                return None
             
-            # Apply to repository
             target_path = self._get_target_path(working_dir_path, target_filename)
-            self._write_file_with_mkdir(target_path, content)
-            
-            self._log_success("CREATE", target_filename)
-            self.applied_count += 1
+            return operation, target_filename, target_path, content
             
         except Exception as e:
-            self._log_error("CREATE", target_filename, e)
+            self._log_error(operation, target_filename, e)
+            return None
     
-    def _apply_update_files(self, result: Result, remediated_map: Dict[str, str],
-                           working_dir_path: Path) -> None:
-        """Apply UPDATE file operations"""
-        update_results = result.generation_results.get('update_results', [])
+    def _apply_file_writes(self, writes: List[Tuple[str, str, Path, str]]) -> None:
+        """Write files concurrently, then report each one in plan order"""
+        if not writes:
+            return
+        
+        # Writes that land on the same path stay in one task so the later one still wins
+        writes_by_path = {}
+        for index, (_, _, target_path, content) in enumerate(writes):
+            writes_by_path.setdefault(target_path, []).append((index, content))
+        
+        errors = {}
+        with ThreadPoolExecutor(max_workers=min(MAX_WRITE_WORKERS, len(writes_by_path))) as executor:
+            futures = [
+                executor.submit(self._write_path, target_path, path_writes)
+                for target_path, path_writes in writes_by_path.items()
+            ]
+            for future in as_completed(futures):
+                errors.update(future.result())
         
-        for update_result in update_results:
-            if update_result.get('success'):
-                self._apply_single_update(update_result, remediated_map, working_dir_path)
+        # Console output and the applied count stay on this thread
+        for index, (operation, target_filename, _, _) in enumerate(writes):
+            if error := errors.get(index):
+                self._log_error(operation, target_filename, error)
+            else:
+                self._log_success(operation, target_filename)
+                self.applied_count += 1
     
-    def _apply_single_update(self, update_result: Dict, remediated_map: Dict[str, str],
-                            working_dir_path: Path) -> None:
-        """Apply a single UPDATE operation"""
-        try:
-            action = update_result.get('action')
-            if not action:
-                return
-            
-            target_filename = action.target_file
-            content = self._get_content_for_file(target_filename, remediated_map, "update")
-            
-            if not content:
-                logger.warning(f"No content found for UPDATE: {target_filename}")
-                return
-            
-            # Apply to repository
-            target_path = self._get_target_path(working_dir_path, target_filename)
-            self._write_file_with_mkdir(target_path, content)
-            
-            self._log_success("UPDATE", target_filename)
-            self.applied_count += 1
-            
-        except Exception as e:
-            self._log_error("UPDATE", target_filename, e)
+    def _write_path(self, target_path: Path, path_writes: List[Tuple[int, str]]) -> Dict[int, Exception]:
+        """Apply the writes for one path in order, returning failures by plan index"""
+        errors = {}
+        for index, content in path_writes:
+            try:
+                self._write_file_with_mkdir(target_path, content)
+            except Exception as e:
+                errors[index] = e
+        return errors
     
     def _apply_toc_changes(self, result: Result, working_dir_path: Path) -> None:
         """Apply TOC.yml changes"""
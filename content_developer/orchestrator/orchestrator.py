@@ -17,7 +17,7 @@ from ..processors import (
 )
 from ..generation import ContentGenerator
 from ..repository import RepositoryManager
-from ..utils import write, mkdir, read
+from ..utils import write, mkdir, read, iter_markdown_files, get_rate_limiter
 from ..constants import MAX_PHASES
 from ..utils.step_tracker import get_step_tracker
 
@@ -47,8 +47,14 @@ class ContentDeveloperOrchestrator:
             api_version=config.api_version,
         )
         
+        # Pace every LLM request made through this run's processors
+        get_rate_limiter().configure(config.max_requests_per_minute, config.max_tokens_per_minute)
+        
         # Initialize repository manager with GitHub token if available
-        self.repo_manager = RepositoryManager(github_token=config.github_token)
+        self.repo_manager = RepositoryManager(
+            github_token=config.github_token,
+            cache_dir=config.work_dir
+        )
         self.dir_confirmator = DirectoryConfirmation(config, self.client)
         self.strategy_confirmator = StrategyConfirmation(config)
         
@@ -206,9 +212,9 @@ class ContentDeveloperOrchestrator:
     
     def _count_markdown_files(self, directory: Path) -> int:
         """Count markdown files in directory"""
-        md_files = list(directory.rglob("*.md"))
-        if not md_files:
+        md_count = sum(1 for _ in iter_markdown_files(directory))
+        if not md_count:
             logger.warning(f"No markdown files found in {directory}")
             logger.info("This may indicate a non-content directory was selected (e.g., media/assets directory)")
             logger.info("Consider re-running with a different content goal or checking the selected directory")
-        return len(md_files)
+        return md_count
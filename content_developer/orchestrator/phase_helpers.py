@@ -2,6 +2,7 @@
 Helper classes for phase execution to reduce code duplication.
 """
 import logging
+from collections import Counter
 from typing import Dict, List, Tuple, Callable, Optional, Any
 from pathlib import Path
 
@@ -160,9 +161,10 @@ class PhaseSummaryDisplay:
         if not self.console_display:
             return
         
-        create_count = sum(1 for d in strategy.decisions if d.action == 'CREATE')
-        update_count = sum(1 for d in strategy.decisions if d.action == 'UPDATE')
-        skip_count = sum(1 for d in strategy.decisions if d.action == 'SKIP')
+        action_counts = Counter(d.action for d in strategy.decisions)
+        create_count = action_counts['CREATE']
+        update_count = action_counts['UPDATE']
+        skip_count = action_counts['SKIP']
         
         self.console_display.show_phase_summary("2: Content Strategy", {
             "Files Analyzed": len(chunks),
@@ -1,21 +1,29 @@
 """
 Content discovery and chunking processor
 """
+import os
 from collections import namedtuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, List, Tuple
 import logging
 
 from ..cache import UnifiedCache
 from ..models import Config, DocumentChunk
-from ..utils import file_get_hash
+from ..utils import file_get_hash, iter_markdown_files
 from ..chunking import SmartChunker
 from .smart_processor import SmartProcessor
+from .strategy_helpers import EmbeddingHelper
 
 logger = logging.getLogger(__name__)
 
 
+def _chunk_file(md_file: Path, file_hash: str) -> List[DocumentChunk]:
+    """Chunk a single markdown file (module level so worker processes can run it)"""
+    logger.info(f"Processing {md_file}")
+    return SmartChunker().chunk_markdown(md_file, None, file_id=file_hash)
+
+
 class ContentDiscoveryProcessor(SmartProcessor):
     """Discover and chunk content in the repository"""
     
@@ -29,38 +37,44 @@ class ContentDiscoveryProcessor(SmartProcessor):
         logger.info("Verifying and cleaning up cache manifest...")
         cache.verify_and_cleanup_manifest()
         
-        # Find all markdown files
+        # Find markdown files lazily; they are checked against the cache as the walk proceeds
         markdown_files = self._find_markdown_files(working_dir)
-        logger.info(f"Found {len(markdown_files)} markdown files")
-        
-        # Process files and generate chunks
-        all_chunks = self._process_markdown_files(markdown_files, cache)
         
-        # Generate embeddings if missing
-        self._generate_missing_embeddings(all_chunks, cache)
+        try:
+            # Process files and generate chunks
+            all_chunks = self._process_markdown_files(markdown_files, cache)
+            
+            # Generate embeddings if missing
+            self._generate_missing_embeddings(all_chunks, cache)
+        finally:
+            # Write manifest changes buffered by the cache
+            cache.flush()
         
         logger.info(f"Content discovery complete: {len(all_chunks)} chunks")
         return all_chunks
     
-    def _find_markdown_files(self, working_dir: Path) -> List[Path]:
+    def _find_markdown_files(self, working_dir: Path) -> Iterator[Path]:
         """Find all markdown files in directory"""
-        return list(working_dir.rglob("*.md"))
+        return iter_markdown_files(working_dir)
     
-    def _process_markdown_files(self, markdown_files: List[Path], cache: UnifiedCache) -> List[DocumentChunk]:
+    def _process_markdown_files(self, markdown_files: Iterable[Path], cache: UnifiedCache) -> List[DocumentChunk]:
         """Process markdown files with intelligent caching"""
         ProcessResult = namedtuple('ProcessResult', ['file_path', 'chunks', 'needs_update'])
         
-        # Check which files need updates
+        # Check which files need updates; each file is hashed once and the
+        # hash is reused for its chunk ids and manifest entry
         files_to_process = []
         cached_chunks = []
+        file_count = 0
         
         for md_file in markdown_files:
+            file_count += 1
             file_hash = file_get_hash(md_file)
             file_key = str(md_file)
             
             # Check if file needs update
             if cache.needs_update(file_key, file_hash):
-                files_to_process.append(md_file)
+                files_to_process.append((md_file, file_hash))
             else:
                 # Load from cache
                 chunks = self._load_chunks_from_cache(md_file, cache)
@@ -68,9 +82,10 @@ class ContentDiscoveryProcessor(SmartProcessor):
                     cached_chunks.extend(chunks)
                 else:
                     # Cache corrupted, reprocess
-                    files_to_process.append(md_file)
+                    files_to_process.append((md_file, file_hash))
         
-        logger.info(f"Files to process: {len(files_to_process)}, cached: {len(markdown_files) - len(files_to_process)}")
+        logger.info(f"Found {file_count} markdown files")
+        logger.info(f"Files to process: {len(files_to_process)}, cached: {file_count - len(files_to_process)}")
         
         # Process files that need updates
         if files_to_process:
@@ -89,9 +104,10 @@ class ContentDiscoveryProcessor(SmartProcessor):
         
         chunks = []
         chunk_ids = manifest_entry.get('chunk_ids', [])
+        cached_entries = cache.get_many(chunk_ids)
         
         for chunk_id in chunk_ids:
-            cached_data = cache.get(chunk_id)
+            cached_data = cached_entries.get(chunk_id)
             if cached_data and 'data' in cached_data:
                 # Get unified chunk data
                 chunk_data = cached_data['data']
@@ -110,7 +126,8 @@ class ContentDiscoveryProcessor(SmartProcessor):
                         chunk_index=chunk_data.get('chunk_index', 0),
                         frontmatter=chunk_data.get('frontmatter', {}),
                         embedding_content=chunk_data.get('embedding_content', ''),
-                        embedding=chunk_data.get('embedding'),  # Load existing embedding if present
+                        # Load existing embedding if present (cached as packed float16)
+                        embedding=EmbeddingHelper.unpack_embedding(chunk_data.get('embedding')),
                         content_hash=chunk_data.get('content_hash'),
                         file_id=chunk_data.get('file_id', ''),
                         chunk_id=chunk_data.get('chunk_id', ''),
@@ -126,84 +143,92 @@ class ContentDiscoveryProcessor(SmartProcessor):
         
         return chunks
     
-    def _process_files_parallel(self, files_to_process: List[Path], 
+    def _process_files_parallel(self, files_to_process: List[Tuple[Path, str]], 
                                cache: UnifiedCache) -> List[DocumentChunk]:
-        """Process multiple files in parallel"""
+        """Process multiple files in parallel
+        
+        Chunking is CPU bound (YAML, regex, hashing), so it runs in worker
+        processes; results are written to the cache here, one file at a time.
+        """
         all_chunks = []
-        chunker = SmartChunker()
         
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            # Submit all files for processing
+        if len(files_to_process) < 2:
+            for md_file, file_hash in files_to_process:
+                try:
+                    chunks = _chunk_file(md_file, file_hash)
+                    self._cache_file_chunks(md_file, file_hash, chunks, cache)
+                    all_chunks.extend(chunks)
+                except Exception as e:
+                    logger.error(f"Failed to process {md_file}: {e}")
+            return all_chunks
+        
+        max_workers = min(os.cpu_count() or 1, len(files_to_process))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # Submit all files for chunking
             future_to_file = {
-                executor.submit(self._process_single_file, md_file, chunker, cache): md_file
-                for md_file in files_to_process
+                executor.submit(_chunk_file, md_file, file_hash): (md_file, file_hash)
+                for md_file, file_hash in files_to_process
             }
             
-            # Collect results as they complete
+            # Cache results as they complete
             for future in as_completed(future_to_file):
-                md_file = future_to_file[future]
+                md_file, file_hash = future_to_file[future]
                 try:
                     chunks = future.result()
+                    self._cache_file_chunks(md_file, file_hash, chunks, cache)
                     all_chunks.extend(chunks)
                 except Exception as e:
                     logger.error(f"Failed to process {md_file}: {e}")
         
         return all_chunks
     
-    def _process_single_file(self, md_file: Path, chunker: SmartChunker, 
-                            cache: UnifiedCache) -> List[DocumentChunk]:
-        """Process a single markdown file"""
-        logger.info(f"Processing {md_file}")
-        
-        # Chunk the file
-        chunks = chunker.chunk_markdown(md_file, cache)
-        
+    def _cache_file_chunks(self, md_file: Path, file_hash: str, chunks: List[DocumentChunk], 
+                           cache: UnifiedCache) -> None:
+        """Store a file's chunks in the cache and update its manifest entry"""
         # Store chunks in cache
         chunk_ids = self._store_chunks_in_cache(chunks, cache)
         
         # Update manifest
-        self._update_file_manifest(md_file, chunk_ids, cache)
-        
-        return chunks
+        self._update_file_manifest(md_file, file_hash, chunk_ids, cache)
     
     def _store_chunks_in_cache(self, chunks: List[DocumentChunk], cache: UnifiedCache) -> List[str]:
         """Store chunks in cache and return their IDs"""
-        chunk_ids = []
-        
-        for chunk in chunks:
-            # Prepare unified data structure
-            unified_data = {
-                'content': chunk.content,
-                'file_path': chunk.file_path,
-                'heading_path': chunk.heading_path,
-                'section_level': chunk.section_level,
-                'chunk_index': chunk.chunk_index,
-                'frontmatter': chunk.frontmatter,
-                'embedding_content': chunk.embedding_content,
-                'embedding': chunk.embedding,  # Will be None initially
-                'embedding_model': None,  # Will be set when embedding is generated
-                'embedding_generated_at': None,  # Will be set when embedding is generated
-                'content_hash': chunk.content_hash,
-                'file_id': chunk.file_id,
-                'chunk_id': chunk.chunk_id,
-                'prev_chunk_id': chunk.prev_chunk_id,
-                'next_chunk_id': chunk.next_chunk_id,
-                'parent_heading_chunk_id': chunk.parent_heading_chunk_id,
-                'total_chunks_in_file': chunk.total_chunks_in_file
-            }
-            
-            # Store with metadata
-            cache.put(chunk.chunk_id, unified_data, {
+        # One put_many per file: a single lock and manifest reload for all of its chunks
+        cache.put_many(
+            (chunk.chunk_id, self._chunk_cache_data(chunk), {
                 'type': 'chunk',
                 'file': chunk.file_path,
                 'section': chunk.heading_path,
                 'has_embedding': chunk.embedding is not None
             })
-            chunk_ids.append(chunk.chunk_id)
-        
-        return chunk_ids
+            for chunk in chunks
+        )
+        return [chunk.chunk_id for chunk in chunks]
+    
+    @staticmethod
+    def _chunk_cache_data(chunk: DocumentChunk) -> Dict:
+        """Build the unified cache data structure for a chunk"""
+        return {
+            'content': chunk.content,
+            'file_path': chunk.file_path,
+            'heading_path': chunk.heading_path,
+            'section_level': chunk.section_level,
+            'chunk_index': chunk.chunk_index,
+            'frontmatter': chunk.frontmatter,
+            'embedding_content': chunk.embedding_content,
+            'embedding': chunk.embedding,  # Will be None initially
+            'embedding_model': None,  # Will be set when embedding is generated
+            'embedding_generated_at': None,  # Will be set when embedding is generated
+            'content_hash': chunk.content_hash,
+            'file_id': chunk.file_id,
+            'chunk_id': chunk.chunk_id,
+            'prev_chunk_id': chunk.prev_chunk_id,
+            'next_chunk_id': chunk.next_chunk_id,
+            'parent_heading_chunk_id': chunk.parent_heading_chunk_id,
+            'total_chunks_in_file': chunk.total_chunks_in_file
+        }
     
-    def _update_file_manifest(self, md_file: Path, chunk_ids: List[str], 
+    def _update_file_manifest(self, md_file: Path, file_hash: str, chunk_ids: List[str], 
                              cache: UnifiedCache) -> None:
         """Update file manifest with new chunk IDs and cleanup orphaned chunks"""
         file_key = str(md_file)
@@ -219,7 +244,7 @@ class ContentDiscoveryProcessor(SmartProcessor):
         # Update manifest
         manifest_entry = {
             'type': 'file',
-            'hash': file_get_hash(md_file),
+            'hash': file_hash,
             'chunk_ids': chunk_ids,
             'chunk_count': len(chunk_ids)
         }
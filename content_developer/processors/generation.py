@@ -6,9 +6,10 @@ from typing import Dict, List, Optional, Tuple
 import logging
 import json
 
+from ..constants import FRONTMATTER_SCAN_LIMIT
 from ..models import Config, ContentDecision, DocumentChunk
 from ..cache import UnifiedCache
-from ..utils import get_hash
+from ..utils import get_hash, extract_from_markdown_block
 from ..prompts import get_create_content_prompt as get_create_prompt, get_update_content_prompt as get_update_prompt, CREATE_CONTENT_SYSTEM as CREATION_SYSTEM, UPDATE_CONTENT_SYSTEM as UPDATE_SYSTEM
 from ..prompts.phase3.material_sufficiency import get_pregeneration_sufficiency_prompt, get_postgeneration_sufficiency_prompt
 from .llm_native_processor import LLMNativeProcessor
@@ -19,6 +20,38 @@ logger = logging.getLogger(__name__)
 class ContentGenerationProcessor(LLMNativeProcessor):
     """Generates content based on strategic decisions using LLM"""
     
+    def __init__(self, client, config: Config, console_display=None):
+        """Initialize with client and config"""
+        super().__init__(client, config, console_display)
+        self._content_standards: Optional[Dict] = None
+        self._content_types_by_name: Dict[str, Dict] = {}
+        self._chunks_by_file: Dict[str, List[DocumentChunk]] = {}
+        self._indexed_chunks: Optional[List[DocumentChunk]] = None  # List _chunks_by_file was built from
+    
+    def _load_content_standards(self) -> Dict:
+        """Load content standards once and reuse them for every decision"""
+        if self._content_standards is None:
+            try:
+                with open('content_standards.json', 'r') as f:
+                    standards = json.load(f)
+            except Exception as e:
+                logger.warning(f"Failed to load content standards: {e}")
+                standards = {
+                    'contentTypes': [],
+                    'formattingElements': [],
+                    'codeGuidelines': {}
+                }
+            
+            # First entry wins, matching the previous linear scan
+            content_types_by_name = {}
+            for ct in standards.get('contentTypes', []):
+                content_types_by_name.setdefault(ct.get('name'), ct)
+            
+            # Publish the index before the standards: decisions may run on several threads
+            self._content_types_by_name = content_types_by_name
+            self._content_standards = standards
+        return self._content_standards
+    
     def _process(self, decision: ContentDecision, materials: List[Dict], 
                  chunks: List[DocumentChunk], config: Config, 
                  repo_name: str, working_directory: str) -> Tuple[str, Dict]:
@@ -133,22 +166,12 @@ class ContentGenerationProcessor(LLMNativeProcessor):
             self.console_display.show_operation(f"Creating new content: {decision.file_title}")
         
         # Load content standards
-        try:
-            with open('content_standards.json', 'r') as f:
-                content_standards = json.load(f)
-        except Exception as e:
-            logger.warning(f"Failed to load content standards: {e}")
-            content_standards = {
-                'contentTypes': [],
-                'formattingElements': [],
-                'codeGuidelines': {}
-            }
+        content_standards = self._load_content_standards()
         
         # Get content type info
         content_type = getattr(decision, 'content_type', 'How-To Guide')
-        content_type_info = next(
-            (ct for ct in content_standards.get('contentTypes', []) 
-             if ct.get('name') == content_type),
+        content_type_info = self._content_types_by_name.get(
+            content_type,
             {
                 'name': content_type,
                 'ms_topic': getattr(decision, 'ms_topic', 'how-to'),
@@ -206,7 +229,7 @@ class ContentGenerationProcessor(LLMNativeProcessor):
         )
         
         # Extract content and metadata
-        content = result.get('content', '')
+        content = extract_from_markdown_block(result.get('content', ''))
         metadata = {
             'thinking': result.get('thinking', ''),
             'sections_created': result.get('sections_created', []),
@@ -240,7 +263,7 @@ class ContentGenerationProcessor(LLMNativeProcessor):
         ms_topic = 'how-to'  # default
         if existing_content.startswith('---\n'):
             # Find the end of frontmatter
-            end_fm_pos = existing_content.find('\n---\n', 4)
+            end_fm_pos = existing_content.find('\n---\n', 4, FRONTMATTER_SCAN_LIMIT)
             if end_fm_pos > 0:
                 frontmatter = existing_content[4:end_fm_pos]
                 # Look for ms.topic in frontmatter
@@ -264,16 +287,7 @@ class ContentGenerationProcessor(LLMNativeProcessor):
         }
         
         # Load content standards from file
-        try:
-            with open('content_standards.json', 'r') as f:
-                content_standards = json.load(f)
-        except Exception as e:
-            logger.warning(f"Failed to load content standards: {e}")
-            content_standards = {
-                'contentTypes': [],
-                'formattingElements': [],
-                'codeGuidelines': {}
-            }
+        content_standards = self._load_content_standards()
         
         # Get the update prompt with all required parameters
         prompt = get_update_prompt(
@@ -300,7 +314,9 @@ class ContentGenerationProcessor(LLMNativeProcessor):
         )
         
         # Extract content and metadata
-        content = result.get('updated_document', result.get('content', ''))  # Handle both response formats
+        content = extract_from_markdown_block(
+            result.get('updated_document', result.get('content', ''))  # Handle both response formats
+        )
         metadata = {
             'thinking': result.get('thinking', ''),
             'sections_updated': result.get('sections_modified', result.get('sections_updated', [])),
@@ -318,15 +334,24 @@ class ContentGenerationProcessor(LLMNativeProcessor):
         return content, metadata
     
     def _get_target_chunks(self, target_file: str, chunks: List[DocumentChunk]) -> List[DocumentChunk]:
-        """Get chunks for the target file"""
-        target_chunks = []
-        for chunk in chunks:
-            if chunk.file_path == target_file:
-                target_chunks.append(chunk)
+        """Get chunks for the target file
+        
+        Every decision is processed against the same chunk list, so chunks are
+        grouped by file once and each lookup is a dict access.
+        """
+        if self._indexed_chunks is not chunks:
+            chunks_by_file = {}
+            for chunk in chunks:
+                chunks_by_file.setdefault(chunk.file_path, []).append(chunk)
+            
+            # Sort by chunk index to maintain order
+            for file_chunks in chunks_by_file.values():
+                file_chunks.sort(key=lambda c: c.chunk_index)
+            
+            self._chunks_by_file = chunks_by_file
+            self._indexed_chunks = chunks
         
-        # Sort by chunk index to maintain order
-        target_chunks.sort(key=lambda c: c.chunk_index)
-        return target_chunks
+        return list(self._chunks_by_file.get(target_file, []))
     
     def _reconstruct_content(self, chunks: List[DocumentChunk]) -> str:
         """Reconstruct full content from chunks"""
@@ -1,6 +1,7 @@
 """
 Material processor for support materials
 """
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional
 import logging
@@ -26,18 +27,50 @@ class MaterialProcessor(SmartProcessor):
         if self.console_display:
             self.console_display.show_operation(f"Processing {len(materials)} support materials")
         
-        summaries = []
-        for i, material in enumerate(materials, 1):
-            if content := self.extractor.extract(material, repo_path):
-                if self.console_display:
-                    self.console_display.show_operation(f"Analyzing material {i}/{len(materials)}: {Path(material).name}")
-                
-                if summary := self._summarize(content, material):
-                    summaries.append(summary)
+        if not materials:
+            logger.info("Processed 0/0 materials")
+            return []
+        
+        # Extraction and LLM summarization are IO bound; overlap them across materials
+        results: List[Optional[Dict]] = [None] * len(materials)
+        with ThreadPoolExecutor(max_workers=min(8, len(materials))) as executor:
+            future_to_index = {
+                executor.submit(self._extract_and_summarize, i, len(materials), material, repo_path): i - 1
+                for i, material in enumerate(materials, 1)
+            }
+            
+            try:
+                for future in as_completed(future_to_index):
+                    index = future_to_index[future]
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to process material {materials[index]}: {e}")
+            except BaseException:
+                # On Ctrl-C, do not start the materials still queued (as
+                # shutdown(cancel_futures=True) would on Python 3.9+)
+                for future in future_to_index:
+                    future.cancel()
+                raise
+        
+        # Keep summaries in the order the materials were given
+        summaries = [summary for summary in results if summary]
         
         logger.info(f"Processed {len(summaries)}/{len(materials)} materials")
         return summaries
     
+    def _extract_and_summarize(self, index: int, total: int, material: str, 
+                               repo_path: Path) -> Optional[Dict]:
+        """Extract a single material and summarize it"""
+        content = self.extractor.extract(material, repo_path)
+        if not content:
+            return None
+        
+        if self.console_display:
+            self.console_display.show_operation(f"Analyzing material {index}/{total}: {Path(material).name}")
+        
+        return self._summarize(content, material)
+    
     def _summarize(self, content: str, source: str) -> Optional[Dict]:
         """Generate summary for material content"""
         prompt = get_material_summary_prompt(source, content)
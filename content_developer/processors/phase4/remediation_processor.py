@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from ...models import Config, Result
-from ...utils import write, mkdir, read, get_step_tracker
+from ...utils import write, read, get_step_tracker
 from ...interactive import RemediationConfirmation
 from ..smart_processor import SmartProcessor
 from .seo_processor import SEOProcessor
@@ -277,8 +277,7 @@ class ContentRemediationProcessor(SmartProcessor):
                                 action_type: str, working_dir_path: Path) -> str:
         """Save remediated content to preview directory - overwrites the same file"""
         # Use the same preview directory structure as phase 3
-        preview_dir = Path("./llm_outputs/preview") / action_type
-        mkdir(preview_dir)
+        preview_dir = self.config.ensure_dir(f"preview/{action_type}")
         
         # Extract just the filename from the full path
         filename_only = Path(filename).name
@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import yaml
 
-from ...utils import write, mkdir, read
+from ...utils import write, read
 from ..llm_native_processor import LLMNativeProcessor
 from ...models import Config
 from ...prompts.phase5 import get_toc_update_prompt, TOC_UPDATE_SYSTEM
@@ -211,8 +211,7 @@ class TOCProcessor(LLMNativeProcessor):
     
     def _save_toc_preview(self, updated_toc: str, working_directory: Path) -> Path:
         """Save TOC preview"""
-        preview_dir = Path("./llm_outputs/preview/toc")
-        preview_dir.mkdir(parents=True, exist_ok=True)
+        preview_dir = self.config.ensure_dir("preview/toc")
         
         # Use working directory name in preview filename
         working_dir_name = working_directory.name
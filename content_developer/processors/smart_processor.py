@@ -6,7 +6,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from ..utils import write, save_json, mkdir
+from ..utils import write_bytes_atomic, mkdir, get_rate_limiter, estimate_message_tokens
 from ..utils.step_tracker import get_step_tracker
 
 
@@ -45,12 +45,16 @@ class SmartProcessor:
         if model is None:
             model = self.config.completion_model
             
+        messages = [
+            {"role": "system", "content": system},
+            {"role": "user", "content": user}
+        ]
+        
+        # Wait for room under the configured requests/tokens per minute, if any
+        get_rate_limiter().acquire(estimate_message_tokens(messages))
         response = self.client.chat.completions.create(
             model=model,
-            messages=[
-                {"role": "system", "content": system},
-                {"role": "user", "content": user}
-            ],
+            messages=messages,
             temperature=self.config.temperature,
             response_format={"type": "json_object"}
         )
@@ -90,6 +94,9 @@ class SmartProcessor:
             model = self.config.completion_model
             
         kwargs = self._build_llm_kwargs(messages, model, response_format)
+        
+        # Wait for room under the configured requests/tokens per minute, if any
+        get_rate_limiter().acquire(estimate_message_tokens(messages, kwargs.get("max_tokens")))
         response = self.client.chat.completions.create(**kwargs)
         
         result = self._parse_llm_response(response, response_format)
@@ -212,12 +219,15 @@ class SmartProcessor:
     def _save_prompt_to_file(self, base_path: Path, prompt: str, operation: str) -> None:
         """Save prompt content to text file"""
         prompt_content = self._format_prompt_content(prompt, operation)
-        write(base_path.with_suffix('.txt'), prompt_content)
+        write_bytes_atomic(base_path.with_suffix('.txt'), prompt_content.encode('utf-8'))
     
     def _save_response_to_file(self, base_path: Path, response: Any, operation: str) -> None:
         """Save response data to JSON file"""
         response_data = self._format_response_data(response, operation)
-        save_json(base_path.with_suffix('.json'), response_data)
+        write_bytes_atomic(
+            base_path.with_suffix('.json'),
+            json.dumps(response_data, indent=2).encode('ascii')
+        )
     
     def _format_prompt_content(self, prompt: str, operation: str) -> str:
         """Format prompt content with metadata header"""
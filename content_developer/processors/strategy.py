@@ -1,6 +1,8 @@
 """
 Content strategy processor using LLM-native approach
 """
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 import logging
@@ -28,6 +30,7 @@ class ContentStrategyProcessor(LLMNativeProcessor):
         self.embedding_helper = EmbeddingHelper(client, config)
         self.file_scorer = FileRelevanceScorer(self.embedding_helper)
         self.file_builder = FileContentBuilder()
+        self._content_standards = None
     
     def _process(self, chunks: List[DocumentChunk], materials: List[Dict], config: Config, 
                  repo_name: str, working_directory: str) -> ContentStrategy:
@@ -53,20 +56,32 @@ class ContentStrategyProcessor(LLMNativeProcessor):
         cache_dir = Path(f"./llm_outputs/embeddings/{repo_name}/{working_directory}")
         cache = UnifiedCache(cache_dir)
         
-        # Create search embedding from materials and goal
-        search_text = self._create_search_text(materials, config)
-        search_embedding = self.embedding_helper.get_embedding(search_text, cache)
-        
-        # Score all chunks using embeddings
-        chunk_scores = self.file_scorer.score_chunks(chunks, search_embedding, cache)
-        
-        # Aggregate scores by file
-        file_relevance = self.file_scorer.aggregate_scores_by_file(chunk_scores, cache)
+        try:
+            # Create search embedding from materials and goal. The two lookups are
+            # independent, so its request runs while chunk embeddings are loaded/generated
+            search_text = self._create_search_text(materials, config)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                search_future = executor.submit(self.embedding_helper.get_embedding, search_text, cache)
+                chunk_embeddings = self.embedding_helper.get_chunk_embeddings(chunks, cache)
+                search_embedding = search_future.result()
+            
+            if not search_embedding:
+                # Nothing to rank against: skip scoring and the manifest scan
+                logger.warning("No search embedding available; continuing without relevant files")
+                return []
+            
+            # Score all chunks using embeddings
+            chunk_scores = self.file_scorer.score_chunks(chunks, search_embedding, cache, chunk_embeddings)
+            
+            # Aggregate scores by file
+            file_relevance = self.file_scorer.aggregate_scores_by_file(chunk_scores, cache)
+        finally:
+            # Write manifest changes buffered while caching new embeddings
+            cache.flush()
         
         # Select top 3 files (changed from 10)
-        top_files = sorted(file_relevance.items(), 
-                          key=lambda x: x[1]['combined_score'], 
-                          reverse=True)[:3]
+        top_files = heapq.nlargest(3, file_relevance.items(), 
+                                   key=lambda x: x[1]['combined_score'])
         
         # Reconstruct full file content
         result = []
@@ -88,15 +103,16 @@ class ContentStrategyProcessor(LLMNativeProcessor):
             f"Service area: {config.service_area}"
         ]
         
-        # Add material topics and key concepts
-        topics = set()
-        concepts = set()
+        # Add material topics and key concepts, deduplicated in first-seen order so the
+        # text (and the cache key of its embedding) is the same on every run
+        topics = {}
+        concepts = {}
         for material in materials:
             if topic := material.get('main_topic'):
-                topics.add(topic)
+                topics[topic] = None
             if material_concepts := material.get('key_concepts'):
                 if isinstance(material_concepts, list):
-                    concepts.update(material_concepts[:5])
+                    concepts.update(dict.fromkeys(material_concepts[:5]))
         
         if topics:
             parts.append(f"Key topics: {', '.join(topics)}")
@@ -106,7 +122,13 @@ class ContentStrategyProcessor(LLMNativeProcessor):
         return " | ".join(parts)
     
     def _load_content_standards(self) -> Dict:
-        """Load content standards from JSON file"""
+        """Load content standards from JSON file (cached after the first call)"""
+        if self._content_standards is None:
+            self._content_standards = self._read_content_standards()
+        return self._content_standards
+    
+    def _read_content_standards(self) -> Dict:
+        """Read content standards from disk, falling back to built-in defaults"""
         standards_path = Path('content_standards.json')
         if standards_path.exists():
             try:
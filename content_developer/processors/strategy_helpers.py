@@ -1,10 +1,15 @@
 """
 Helper classes for content strategy processing.
 """
+import base64
+import heapq
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Optional, Union
+
+import numpy as np
 
 from ..cache import UnifiedCache
 from ..models import DocumentChunk
@@ -12,6 +17,12 @@ from ..utils import get_hash
 
 logger = logging.getLogger(__name__)
 
+# Inputs per embeddings.create request when generating missing chunk embeddings
+EMBEDDING_BATCH_SIZE = 96
+
+# Concurrent embeddings.create requests (the client retries 429s with backoff itself)
+EMBEDDING_MAX_WORKERS = 8
+
 
 class EmbeddingHelper:
     """Handles embedding operations with caching"""
@@ -36,7 +47,7 @@ class EmbeddingHelper:
             )
             embedding = response.data[0].embedding
             # Save to cache
-            cache.put(cache_key, embedding, meta={'type': f'{cache_prefix}_embedding'})
+            cache.put(cache_key, self.pack_embedding(embedding), meta={'type': f'{cache_prefix}_embedding'})
             return embedding
         except Exception as e:
             logger.error(f"Failed to create embedding: {e}")
@@ -44,24 +55,12 @@ class EmbeddingHelper:
     
     def get_chunk_embedding(self, chunk: DocumentChunk, cache: UnifiedCache) -> List[float]:
         """Get or compute embedding for a chunk"""
-        if chunk.embedding:
+        if self._has_values(chunk.embedding):
             logger.debug(f"Using embedding from chunk object for {chunk.chunk_id}")
             return self._ensure_float_list(chunk.embedding)
         
-        # Try to get from cache - use chunk_id directly without prefix
-        cache_key = chunk.chunk_id
-        if cached_data := cache.get(cache_key):
-            # For chunk data, embedding is nested inside the data object
-            if data := cached_data.get('data'):
-                if isinstance(data, dict) and 'embedding' in data:
-                    # This is a chunk with nested structure
-                    if embedding := data.get('embedding'):
-                        logger.debug(f"Found cached embedding for chunk {chunk.chunk_id}")
-                        return self._ensure_float_list(embedding)
-                elif isinstance(data, list):
-                    # This is a direct embedding array (shouldn't happen for chunks)
-                    logger.warning(f"Found direct embedding array for chunk {chunk.chunk_id} - this shouldn't happen")
-                    return self._ensure_float_list(data)
+        if embedding := self._get_cached_chunk_embedding(chunk, cache):
+            return embedding
         
         # Generate embedding
         logger.info(f"Generating new embedding for chunk {chunk.chunk_id}")
@@ -73,31 +72,115 @@ class EmbeddingHelper:
                 model=self.config.embedding_model,
                 input=embedding_text
             )
-            embedding = response.data[0].embedding
-            
-            # For chunks, we need to update the existing chunk data in cache
-            cache_key = chunk.chunk_id
-            if cached_data := cache.get(cache_key):
-                if data := cached_data.get('data'):
-                    if isinstance(data, dict):
-                        # Update the existing chunk data with the embedding
-                        data['embedding'] = embedding
-                        data['embedding_model'] = self.config.embedding_model
-                        data['embedding_generated_at'] = datetime.now().isoformat()
-                        
-                        # Save the updated chunk data back to cache
-                        cache.put(cache_key, data, cached_data.get('meta', {}))
-                        
-                        return self._ensure_float_list(embedding)
-            
-            # If no existing chunk data, just return the embedding
-            # (This shouldn't normally happen for chunks)
-            return embedding
-            
+            return self._store_chunk_embedding(chunk, response.data[0].embedding, cache)
         except Exception as e:
             logger.error(f"Failed to create embedding for chunk: {e}")
             return []
     
+    def get_chunk_embeddings(self, chunks: List[DocumentChunk], 
+                             cache: UnifiedCache) -> Dict[str, Union[List[float], np.ndarray]]:
+        """Get embeddings for many chunks, generating cache misses in batched requests
+        
+        Returns a chunk_id -> embedding map; chunks whose embedding could not be
+        created are left out. Embeddings loaded from the cache are float32
+        arrays, freshly generated ones are float lists.
+        """
+        embeddings = {}
+        misses = []
+        for chunk in chunks:
+            if self._has_values(chunk.embedding):
+                embeddings[chunk.chunk_id] = chunk.embedding
+            elif embedding := self._get_cached_chunk_embedding(chunk, cache):
+                embeddings[chunk.chunk_id] = embedding
+            else:
+                misses.append(chunk)
+        
+        if misses:
+            logger.info(f"Generating {len(misses)} chunk embeddings in batches of {EMBEDDING_BATCH_SIZE}")
+        
+        if not misses:
+            return embeddings
+        
+        # Batches are independent HTTP requests: run them concurrently, but write
+        # results to the cache from this thread only
+        batches = [misses[start:start + EMBEDDING_BATCH_SIZE] 
+                   for start in range(0, len(misses), EMBEDDING_BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=min(EMBEDDING_MAX_WORKERS, len(batches))) as executor:
+            future_to_batch = {executor.submit(self._embed_batch, batch): batch for batch in batches}
+            
+            try:
+                for future in as_completed(future_to_batch):
+                    batch = future_to_batch[future]
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        # Retry this batch one chunk at a time so a single bad input does not drop the rest
+                        logger.warning(f"Batch embedding request failed, retrying individually: {e}")
+                        for chunk in batch:
+                            if embedding := self.get_chunk_embedding(chunk, cache):
+                                embeddings[chunk.chunk_id] = embedding
+                        continue
+                    
+                    for item in sorted(response.data, key=lambda item: item.index):
+                        chunk = batch[item.index]
+                        embeddings[chunk.chunk_id] = self._store_chunk_embedding(chunk, item.embedding, cache)
+            except BaseException:
+                # On an error or Ctrl-C, do not send the batches still queued (as
+                # shutdown(cancel_futures=True) would on Python 3.9+)
+                for future in future_to_batch:
+                    future.cancel()
+                raise
+        
+        return embeddings
+    
+    def _embed_batch(self, batch: List[DocumentChunk]):
+        """Request embeddings for a batch of chunks in a single call"""
+        return self.client.embeddings.create(
+            model=self.config.embedding_model,
+            input=[self.create_chunk_embedding_text(chunk) for chunk in batch]
+        )
+    
+    def _get_cached_chunk_embedding(self, chunk: DocumentChunk, 
+                                    cache: UnifiedCache) -> Optional[List[float]]:
+        """Return the chunk's embedding from the cache, or None if it has none"""
+        # Try to get from cache - use chunk_id directly without prefix
+        if cached_data := cache.get(chunk.chunk_id):
+            # For chunk data, embedding is nested inside the data object
+            if data := cached_data.get('data'):
+                if isinstance(data, dict) and 'embedding' in data:
+                    # This is a chunk with nested structure
+                    if embedding := data.get('embedding'):
+                        logger.debug(f"Found cached embedding for chunk {chunk.chunk_id}")
+                        return self._ensure_float_list(embedding)
+                elif isinstance(data, list):
+                    # This is a direct embedding array (shouldn't happen for chunks)
+                    logger.warning(f"Found direct embedding array for chunk {chunk.chunk_id} - this shouldn't happen")
+                    return self._ensure_float_list(data)
+        return None
+    
+    def _store_chunk_embedding(self, chunk: DocumentChunk, embedding: List[float], 
+                               cache: UnifiedCache) -> List[float]:
+        """Write a new embedding into the chunk's cached data and return it"""
+        # For chunks, we need to update the existing chunk data in cache
+        cache_key = chunk.chunk_id
+        if cached_data := cache.get(cache_key):
+            if data := cached_data.get('data'):
+                if isinstance(data, dict):
+                    # Update a copy; cache.get returns the cache's own memoized dict
+                    data = dict(data)
+                    data['embedding'] = self.pack_embedding(embedding)
+                    data['embedding_model'] = self.config.embedding_model
+                    data['embedding_generated_at'] = datetime.now().isoformat()
+                    
+                    # Save the updated chunk data back to cache
+                    cache.put(cache_key, data, cached_data.get('meta', {}))
+                    
+                    return self._ensure_float_list(embedding)
+        
+        # If no existing chunk data, just return the embedding
+        # (This shouldn't normally happen for chunks)
+        return embedding
+    
     @staticmethod
     def create_chunk_embedding_text(chunk: DocumentChunk) -> str:
         """Create text for chunk embedding"""
@@ -124,22 +207,82 @@ class EmbeddingHelper:
     @staticmethod
     def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
         """Calculate cosine similarity between two vectors"""
-        if not vec1 or not vec2 or len(vec1) != len(vec2):
+        if vec1 is None or vec2 is None or len(vec1) == 0 or len(vec1) != len(vec2):
             return 0.0
         
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = sum(a * a for a in vec1) ** 0.5
-        norm2 = sum(b * b for b in vec2) ** 0.5
+        a = np.asarray(vec1, dtype=np.float64)
+        b = np.asarray(vec2, dtype=np.float64)
+        norm1 = float(np.linalg.norm(a))
+        norm2 = float(np.linalg.norm(b))
         
         if norm1 == 0 or norm2 == 0:
             return 0.0
         
-        return dot_product / (norm1 * norm2)
+        return float(a @ b) / (norm1 * norm2)
+    
+    @staticmethod
+    def cosine_similarities(matrix: np.ndarray, vector: List[float], 
+                            unit_rows: bool = False) -> np.ndarray:
+        """Cosine similarity of every row of an (N, D) matrix against one vector
+        
+        One matrix-vector product replaces N Python-level dot products; rows or
+        vectors with zero norm score 0.0, as in cosine_similarity. Pass
+        unit_rows=True when every row is a unit (or zero) vector to skip the
+        row norms.
+        """
+        query = np.asarray(vector, dtype=np.float32)
+        query_norm = float(np.linalg.norm(query))
+        if not len(matrix) or query_norm == 0:
+            return np.zeros(len(matrix), dtype=np.float32)
+        
+        if unit_rows:
+            return (matrix @ query) / np.float32(query_norm)
+        
+        norms = np.linalg.norm(matrix, axis=1) * query_norm
+        dots = matrix @ query
+        return np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
     
     @staticmethod
     def _ensure_float_list(embedding: List) -> List[float]:
         """Ensure embedding is a list of floats"""
-        return [float(x) for x in embedding]
+        if isinstance(embedding, str):
+            embedding = EmbeddingHelper.unpack_embedding(embedding)
+        return np.asarray(embedding, dtype=np.float64).tolist()
+    
+    @staticmethod
+    def _has_values(embedding) -> bool:
+        """True if embedding is a non-empty list or array (arrays have no truth value)"""
+        return embedding is not None and len(embedding) > 0
+    
+    @staticmethod
+    def pack_embedding(embedding: List[float]) -> str:
+        """Encode an embedding for the cache as base64 float16 bytes of its unit vector
+        
+        A 1536-d vector packs to ~4KB instead of ~30KB of JSON floats; float16
+        keeps cosine scores accurate to about 1e-3. Storing the unit vector
+        lets scoring skip the per-row norm (cosine ignores length anyway).
+        """
+        return base64.b64encode(EmbeddingHelper.unit_vector(embedding).astype('<f2').tobytes()).decode('ascii')
+    
+    @staticmethod
+    def unit_vector(embedding) -> np.ndarray:
+        """Return embedding as a float32 array scaled to unit length (zero vectors stay zero)"""
+        vector = np.array(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        return vector
+    
+    @staticmethod
+    def unpack_embedding(embedding) -> Optional[Union[List[float], np.ndarray]]:
+        """Decode a cached embedding to a float32 array; float lists from older caches pass through
+        
+        Keeping the array (instead of a list of Python floats) lets score_chunks
+        stack chunk embeddings into its matrix with a plain memory copy.
+        """
+        if isinstance(embedding, str):
+            return np.frombuffer(base64.b64decode(embedding), dtype='<f2').astype(np.float32)
+        return embedding
 
 
 class FileRelevanceScorer:
@@ -149,14 +292,48 @@ class FileRelevanceScorer:
         self.embedding_helper = embedding_helper
     
     def score_chunks(self, chunks: List[DocumentChunk], search_embedding: List[float], 
-                    cache: UnifiedCache) -> Dict[str, Dict]:
-        """Score all chunks using embeddings"""
+                    cache: UnifiedCache, 
+                    chunk_embeddings: Optional[Dict[str, Union[List[float], np.ndarray]]] = None) -> Dict[str, Dict]:
+        """Score all chunks using embeddings
+        
+        chunk_embeddings may be passed in when already fetched with
+        EmbeddingHelper.get_chunk_embeddings; otherwise it is fetched here.
+        """
         chunk_scores = {}
+        if not search_embedding:
+            return chunk_scores
         
+        # Stack matching-dimension embeddings into one matrix and score them together
+        dimension = len(search_embedding)
+        scored_chunks = []
+        rows = []
+        # Embeddings already on the chunk go straight into the matrix without a list copy;
+        # missing ones are generated in batched requests
+        if chunk_embeddings is None:
+            chunk_embeddings = self.embedding_helper.get_chunk_embeddings(chunks, cache)
         for chunk in chunks:
-            chunk_embedding = self.embedding_helper.get_chunk_embedding(chunk, cache)
-            if chunk_embedding and search_embedding:
-                score = self.embedding_helper.cosine_similarity(search_embedding, chunk_embedding)
+            chunk_embedding = chunk_embeddings.get(chunk.chunk_id)
+            if chunk_embedding is None or len(chunk_embedding) == 0:
+                continue
+            if len(chunk_embedding) == dimension:
+                scored_chunks.append(chunk)
+                # Cached arrays are unit vectors already (see pack_embedding);
+                # float lists are normalized so every row is a unit vector
+                if not isinstance(chunk_embedding, np.ndarray):
+                    chunk_embedding = self.embedding_helper.unit_vector(chunk_embedding)
+                rows.append(chunk_embedding)
+            else:
+                # Dimension mismatch scores 0.0, as cosine_similarity does
+                chunk_scores[chunk.chunk_id] = {
+                    'chunk': chunk,
+                    'score': 0.0,
+                    'file_path': chunk.file_path
+                }
+        
+        if rows:
+            matrix = np.asarray(rows, dtype=np.float32)
+            scores = self.embedding_helper.cosine_similarities(matrix, search_embedding, unit_rows=True)
+            for chunk, score in zip(scored_chunks, scores.tolist()):
                 chunk_scores[chunk.chunk_id] = {
                     'chunk': chunk,
                     'score': score,
@@ -168,9 +345,13 @@ class FileRelevanceScorer:
     def aggregate_scores_by_file(self, chunk_scores: Dict[str, Dict], 
                                 cache: UnifiedCache) -> Dict[str, Dict]:
         """Aggregate chunk scores by file using manifest"""
-        file_relevance = {}
+        file_keys = []
+        file_chunk_lists = []
+        score_file_idx = []
+        score_values = []
+        score_chunk_ids = []
         
-        # Get all file entries from manifest
+        # Gather every scored chunk with the index of its file from the manifest
         with cache._lock:
             cache.reload_manifest()
             for file_key, entry in cache.manifest.items():
@@ -178,37 +359,47 @@ class FileRelevanceScorer:
                     continue
                 
                 file_chunk_ids = entry.get('chunk_ids', [])
-                file_scores, relevant_chunks = self._calculate_file_scores(
-                    file_chunk_ids, chunk_scores
-                )
+                file_index = len(file_keys)
+                file_keys.append(file_key)
+                file_chunk_lists.append(file_chunk_ids)
                 
-                if file_scores:
-                    file_relevance[file_key] = {
-                        'max_score': max(file_scores),
-                        'avg_score': sum(file_scores) / len(file_scores),
-                        'num_relevant_chunks': len(relevant_chunks),
-                        'combined_score': max(file_scores) * 0.6 + (sum(file_scores) / len(file_scores)) * 0.4,
-                        'chunk_ids': file_chunk_ids,
-                        'relevant_chunk_ids': relevant_chunks
-                    }
+                for chunk_id in file_chunk_ids:
+                    scored = chunk_scores.get(chunk_id)
+                    if scored is not None:
+                        score_file_idx.append(file_index)
+                        score_values.append(scored['score'])
+                        score_chunk_ids.append(chunk_id)
         
-        return file_relevance
-    
-    @staticmethod
-    def _calculate_file_scores(file_chunk_ids: List[str], 
-                              chunk_scores: Dict[str, Dict]) -> Tuple[List[float], List[str]]:
-        """Calculate scores for a file's chunks"""
-        file_scores = []
-        relevant_chunks = []
+        if not score_values:
+            return {}
         
-        for chunk_id in file_chunk_ids:
-            if chunk_id in chunk_scores:
-                score = chunk_scores[chunk_id]['score']
-                file_scores.append(score)
-                if score > 0.7:  # Relevance threshold
-                    relevant_chunks.append(chunk_id)
+        # Per-file count, sum and max in a few array passes
+        num_files = len(file_keys)
+        file_idx = np.asarray(score_file_idx, dtype=np.intp)
+        values = np.asarray(score_values, dtype=np.float64)
+        counts = np.bincount(file_idx, minlength=num_files)
+        sums = np.bincount(file_idx, weights=values, minlength=num_files)
+        maxes = np.full(num_files, -np.inf)
+        np.maximum.at(maxes, file_idx, values)
+        
+        relevant_chunks = [[] for _ in range(num_files)]
+        for position in np.flatnonzero(values > 0.7):  # Relevance threshold
+            relevant_chunks[file_idx[position]].append(score_chunk_ids[position])
         
-        return file_scores, relevant_chunks
+        file_relevance = {}
+        for file_index in np.flatnonzero(counts).tolist():
+            max_score = float(maxes[file_index])
+            avg_score = float(sums[file_index] / counts[file_index])
+            file_relevance[file_keys[file_index]] = {
+                'max_score': max_score,
+                'avg_score': avg_score,
+                'num_relevant_chunks': len(relevant_chunks[file_index]),
+                'combined_score': max_score * 0.6 + avg_score * 0.4,
+                'chunk_ids': file_chunk_lists[file_index],
+                'relevant_chunk_ids': relevant_chunks[file_index]
+            }
+        
+        return file_relevance
 
 
 class FileContentBuilder:
@@ -249,16 +440,19 @@ class FileContentBuilder:
                            all_chunks: List[DocumentChunk]) -> List[DocumentChunk]:
         """Collect all chunks for a file"""
         file_chunks = []
+        chunks_by_id = None
         
         for chunk_id in chunk_ids:
             if chunk_id in chunk_scores:
                 file_chunks.append(chunk_scores[chunk_id]['chunk'])
             else:
-                # Try to find chunk in all_chunks if not in scores
-                for chunk in all_chunks:
-                    if chunk.chunk_id == chunk_id:
-                        file_chunks.append(chunk)
-                        break
+                # Try to find chunk in all_chunks if not in scores; index them once on the first miss
+                if chunks_by_id is None:
+                    chunks_by_id = {}
+                    for chunk in all_chunks:
+                        chunks_by_id.setdefault(chunk.chunk_id, chunk)
+                if chunk := chunks_by_id.get(chunk_id):
+                    file_chunks.append(chunk)
         
         return file_chunks
     
@@ -310,10 +504,11 @@ class FileContentBuilder:
         """Get the most relevant sections within a file"""
         relevant_sections = []
         
-        for chunk_id in relevant_chunk_ids[:5]:  # Top 5 relevant sections
-            if chunk_id not in chunk_scores:
-                continue
-            
+        # Top 5 relevant sections by their actual scores, not by position in the file
+        scored_ids = [chunk_id for chunk_id in relevant_chunk_ids if chunk_id in chunk_scores]
+        top_ids = heapq.nlargest(5, scored_ids, key=lambda chunk_id: chunk_scores[chunk_id]['score'])
+        
+        for chunk_id in top_ids:
             chunk = chunk_scores[chunk_id]['chunk']
             score = chunk_scores[chunk_id]['score']
             
@@ -326,4 +521,4 @@ class FileContentBuilder:
                 'preview': preview
             })
         
-        return sorted(relevant_sections, key=lambda x: x['score'], reverse=True) 
\ No newline at end of file
+        return relevant_sections 
\ No newline at end of file
@@ -2,21 +2,42 @@
 Repository management for cloning and updating git repositories
 """
 import logging
+import os
 import subprocess
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from urllib.parse import urlparse, urlunparse
 import re
 
 logger = logging.getLogger(__name__)
 
+# How long GitHub API probe responses stay fresh in the on-disk cache (seconds)
+GITHUB_PROBE_CACHE_TTL = 3600
+
+# Directories left out of the repository structure shown to the model
+SKIP_DIRECTORIES = frozenset({
+    'node_modules', 'dist', 'build', 'target', '.git', 
+    'test', 'tests', '__pycache__', 'coverage', 'media', 
+    'images', 'assets', 'static', 'vendor', 'dependencies'
+})
+
+# File names that mark a directory as having a table of contents
+TOC_FILE_NAMES = frozenset({'TOC.yml', 'toc.yml'})
+
 
 class RepositoryManager:
     """Manage git repository operations"""
     
-    def __init__(self, github_token: Optional[str] = None):
-        """Initialize with optional GitHub token for private repositories"""
+    def __init__(self, github_token: Optional[str] = None, cache_dir: Optional[Path] = None):
+        """Initialize with optional GitHub token for private repositories
+        
+        Args:
+            github_token: Token used to authenticate GitHub clones
+            cache_dir: Directory for the on-disk GitHub API response cache
+        """
         self.github_token = github_token
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._session = None
     
     @staticmethod
     def extract_name(url: str) -> str:
@@ -112,7 +133,7 @@ class RepositoryManager:
         logger.info(f"Cloning {self._mask_url(clone_url)} to {repo_path}")
         
         try:
-            self._run_git(["git", "clone", "--depth", "1", clone_url, str(repo_path)])
+            self._run_git(["git", "clone", "--depth", "1", "--single-branch", clone_url, str(repo_path)])
             logger.info("Repository cloned successfully")
             return repo_path
         except subprocess.CalledProcessError as e:
@@ -161,8 +182,7 @@ class RepositoryManager:
         
         # Try to access public API endpoint
         try:
-            import requests
-            response = requests.get(
+            response = self._get_http_session().get(
                 f"https://api.github.com/repos/{owner}/{repo}",
                 timeout=3,
                 headers={'Accept': 'application/vnd.github.v3+json'}
@@ -173,80 +193,104 @@ class RepositoryManager:
             # If we can't check, assume it might be private
             return True
     
-    @staticmethod
-    def _count_md_files(path: Path) -> int:
-        """Count markdown files in a directory (non-recursive)"""
+    def _get_http_session(self):
+        """Get HTTP session, backed by an on-disk cache when requests-cache is available"""
+        if self._session is not None:
+            return self._session
+        
+        # Imported here rather than with the other optional modules: the probe
+        # only runs after a failed clone
         try:
-            return len([f for f in path.iterdir() if f.is_file() and f.suffix.lower() == '.md'])
-        except:
-            return 0
+            from requests_cache import CachedSession
+        except ImportError:
+            CachedSession = None
+        
+        if CachedSession and self.cache_dir:
+            # Probe results survive process restarts and are revalidated via ETag
+            self._session = CachedSession(
+                cache_name=str(self.cache_dir / '.gh_cache'),
+                backend='sqlite',
+                expire_after=GITHUB_PROBE_CACHE_TTL,
+                cache_control=True,
+                allowable_codes=(200, 404)
+            )
+        else:
+            import requests
+            self._session = requests.Session()
+        
+        return self._session
     
     @staticmethod
-    def _has_toc(path: Path) -> bool:
-        """Check if directory has TOC.yml"""
-        return (path / "TOC.yml").exists() or (path / "toc.yml").exists()
+    def _scan_directory(path: Path) -> Tuple[List[Path], int, bool]:
+        """Read a directory once: visible subdirectories (by name), .md file count, and TOC presence
+        
+        os.scandir entries carry their type from the directory read, so most
+        entries need no extra stat call.
+        """
+        subdirectories = []
+        md_count = 0
+        has_toc = False
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name in TOC_FILE_NAMES:
+                        has_toc = True
+                    if entry.is_dir():
+                        if not name.startswith('.') and not RepositoryManager._should_skip_directory(name):
+                            subdirectories.append(Path(entry.path))
+                    elif entry.is_file() and os.path.splitext(name)[1].lower() == '.md':
+                        md_count += 1
+        except OSError:
+            return [], 0, False
+        
+        subdirectories.sort(key=lambda directory: directory.name)
+        return subdirectories, md_count, has_toc
     
     @staticmethod
     def _should_skip_directory(dir_name: str) -> bool:
         """Check if directory should be skipped"""
-        skip_dirs = {
-            'node_modules', 'dist', 'build', 'target', '.git', 
-            'test', 'tests', '__pycache__', 'coverage', 'media', 
-            'images', 'assets', 'static', 'vendor', 'dependencies'
-        }
-        return dir_name.lower() in skip_dirs
+        return dir_name.lower() in SKIP_DIRECTORIES
     
     def get_directory_structure(self, repo_path: Path, max_depth: int = 3) -> str:
         """Get repository directory structure with markdown file counts"""
         lines = []
         
         # Add repository root info
-        root_md_count = self._count_md_files(repo_path)
-        root_toc = " [TOC]" if self._has_toc(repo_path) else ""
+        root_directories, root_md_count, root_has_toc = self._scan_directory(repo_path)
+        root_toc = " [TOC]" if root_has_toc else ""
         lines.append(f"[Repository Root]{root_toc} ({root_md_count} .md)")
         
         # Build directory tree
-        self._add_directory_tree(repo_path, lines, "", 0, max_depth)
+        self._add_directory_tree(root_directories, lines, "", 0, max_depth)
         
         return "\n".join(lines)
     
-    def _add_directory_tree(self, path: Path, lines: List[str], prefix: str, 
+    def _add_directory_tree(self, directories: List[Path], lines: List[str], prefix: str, 
                            depth: int, max_depth: int) -> None:
         """Add directory tree to lines list"""
         if depth > max_depth:
             return
         
-        # Get only directories
-        directories = self._get_valid_directories(path)
-        
         for i, dir_item in enumerate(directories):
             is_last = i == len(directories) - 1
-            self._add_directory_line(dir_item, lines, prefix, is_last)
+            
+            # One scan gives this directory's line details and its children
+            subdirectories, md_count, has_toc = self._scan_directory(dir_item)
+            self._add_directory_line(dir_item, md_count, has_toc, lines, prefix, is_last)
             
             # Recurse into subdirectories
             extension = "    " if is_last else "│   "
-            self._add_directory_tree(dir_item, lines, prefix + extension, 
+            self._add_directory_tree(subdirectories, lines, prefix + extension, 
                                    depth + 1, max_depth)
     
-    def _get_valid_directories(self, path: Path) -> List[Path]:
-        """Get list of valid directories to display"""
-        try:
-            dirs = [item for item in sorted(path.iterdir(), key=lambda x: x.name) 
-                   if item.is_dir() and not item.name.startswith('.')]
-            
-            # Filter out directories we should skip
-            return [d for d in dirs if not self._should_skip_directory(d.name)]
-        except:
-            return []
-    
-    def _add_directory_line(self, dir_item: Path, lines: List[str], 
-                           prefix: str, is_last: bool) -> None:
+    def _add_directory_line(self, dir_item: Path, md_count: int, has_toc: bool, 
+                            lines: List[str], prefix: str, is_last: bool) -> None:
         """Add a single directory line to the output"""
         current = "└── " if is_last else "├── "
         
-        # Count markdown files and check for TOC
-        md_count = self._count_md_files(dir_item)
-        toc_indicator = " [TOC]" if self._has_toc(dir_item) else ""
+        # Markdown file count and TOC indicators
+        toc_indicator = " [TOC]" if has_toc else ""
         md_indicator = f" ({md_count} .md)" if md_count > 0 else ""
         
         # Show directory with indicators
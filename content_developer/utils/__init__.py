@@ -2,11 +2,12 @@
 Utils module for AI Content Developer
 """
 from .core_utils import (
-    get_hash, error_handler
+    get_hash, new_content_hasher, error_handler, extract_from_markdown_block
 )
 from .file_ops import (
-    read, write, save_json, load_json, 
-    get_hash as file_get_hash, mkdir
+    read, write, write_bytes_atomic, save_json, load_json, 
+    dumps_json, loads_json, get_hash as file_get_hash, mkdir,
+    iter_markdown_files
 )
 from .imports import (
     get_import, initialize_imports,
@@ -14,14 +15,16 @@ from .imports import (
     HAS_WEB
 )
 from .step_tracker import get_step_tracker, StepTracker
+from .rate_limiter import get_rate_limiter, RateLimiter, estimate_message_tokens
 
 __all__ = [
     # Core utilities
-    'get_hash', 'error_handler',
+    'get_hash', 'new_content_hasher', 'error_handler', 'extract_from_markdown_block',
     
     # File operations
-    'read', 'write', 'save_json', 'load_json', 
-    'file_get_hash', 'mkdir',
+    'read', 'write', 'write_bytes_atomic', 'save_json', 'load_json', 
+    'dumps_json', 'loads_json', 'file_get_hash', 'mkdir',
+    'iter_markdown_files',
     
     # Imports
     'get_import', 'initialize_imports',
@@ -29,5 +32,8 @@ __all__ = [
     'HAS_WEB',
     
     # Step tracking
-    'get_step_tracker', 'StepTracker'
+    'get_step_tracker', 'StepTracker',
+    
+    # Rate limiting
+    'get_rate_limiter', 'RateLimiter', 'estimate_message_tokens'
 ]
@@ -2,6 +2,8 @@
 Core utilities for AI Content Developer
 """
 import hashlib
+import os
+import re
 from functools import wraps
 from typing import Callable
 import logging
@@ -10,26 +12,71 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-# Hash generation for string content
-get_hash = lambda content: hashlib.sha256(content.encode('utf-8')).hexdigest()
+# Hash generation for string content (BLAKE2b-256: same 64-char hex length as SHA-256, faster)
+get_hash = lambda content: hashlib.blake2b(content.encode('utf-8'), digest_size=32).hexdigest()
+
+# Incremental form of get_hash: feeding the UTF-8 bytes of a string in pieces gives the same digest
+new_content_hasher = lambda: hashlib.blake2b(digest_size=32)
+
+# Matches a response wrapped entirely in a ``` / ```` (optionally markdown) fence
+_FENCE_RE = re.compile(r'^`{3,4}(?:markdown|md)?[ \t]*\n(.*?)\n`{3,4}$', re.DOTALL)
+
+
+def extract_from_markdown_block(content: str) -> str:
+    """
+    Strip a markdown code fence that wraps an entire LLM response
+    
+    Args:
+        content: Raw content returned by the LLM
+        
+    Returns:
+        Content inside the fence, or the original content if it is not fenced
+    """
+    if not content:
+        return content
+    
+    stripped = content.strip()
+    # Almost no responses are fenced; skip the regex unless one could match
+    if not stripped.startswith('```'):
+        return content
+    
+    match = _FENCE_RE.match(stripped)
+    if not match:
+        return content
+    
+    inner = match.group(1)
+    # A fence line inside means the response holds several blocks, not one wrapped one
+    if '\n```' in '\n' + inner:
+        return content
+    return inner.strip()
+
+
+def _safe_mode_enabled() -> bool:
+    """Check whether error_handler should swallow exceptions (ACD_SAFE_MODE, default on)"""
+    return os.environ.get('ACD_SAFE_MODE', '1') == '1'
+
 
 def error_handler(func: Callable) -> Callable:
     """
     Decorator to handle errors gracefully
     
+    With ACD_SAFE_MODE=0 the function is returned undecorated, so calls
+    skip the wrapper entirely and exceptions propagate to the caller.
+    
     Args:
         func: Function to wrap
         
     Returns:
         Wrapped function that returns None on error
     """
+    if not _safe_mode_enabled():
+        return func
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            logger.error(f"Error in {func.__name__}: {e}")
+            logger.error("Error in %s: %s", func.__name__, e)
             return None
     return wrapper
-
- 
\ No newline at end of file
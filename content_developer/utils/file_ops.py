@@ -3,8 +3,11 @@ File operations utilities
 """
 import json
 import hashlib
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
+
+from .imports import get_import
 
 
 def read(path: Path, limit: Optional[int] = None) -> str:
@@ -24,34 +27,133 @@ def write(path: Path, content: str) -> None:
     Path(path).write_text(content)
 
 
-def save_json(path: Path, data: Dict[str, Any]) -> None:
-    """Save data as JSON"""
-    Path(path).write_text(json.dumps(data, indent=2))
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write bytes to file atomically via a temporary file and rename
+    
+    Readers never observe a partially written file: data is flushed to a
+    sibling .tmp file, fsynced, then moved over the target.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    
+    os.replace(tmp_path, path)
+
+
+def dumps_json(data: Any, compact: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed
+    
+    NumPy arrays (e.g. embeddings) are written as plain JSON arrays.
+    
+    Args:
+        data: JSON-serializable data
+        compact: Skip indentation; for machine-read data such as cache entries
+    """
+    orjson = get_import('orjson')
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if compact:
+        return json.dumps(data, separators=(',', ':'), default=_json_default).encode('ascii')
+    # json.dumps escapes non-ASCII by default, so the ASCII encode is lossless
+    return json.dumps(data, indent=2, default=_json_default).encode('ascii')
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for the stdlib json module: NumPy arrays and scalars"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads_json(data: bytes) -> Any:
+    """Deserialize JSON bytes, using orjson when it is installed"""
+    orjson = get_import('orjson')
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def save_json(path: Path, data: Dict[str, Any], compact: bool = False) -> None:
+    """Save data as JSON (UTF-8), using orjson when it is installed
+    
+    Args:
+        path: Path to file to write
+        data: JSON-serializable data
+        compact: Skip indentation; for machine-read files such as cache entries
+    """
+    Path(path).write_bytes(dumps_json(data, compact=compact))
 
 
 def load_json(path: Path) -> Dict[str, Any]:
-    """Load JSON file"""
+    """Load JSON file, using orjson when it is installed"""
     path = Path(path)
     if not path.exists():
         return {}
     
     try:
-        return json.loads(path.read_text())
-    except json.JSONDecodeError:
+        return loads_json(path.read_bytes())
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
         return {}
 
 
+# Read size for streaming file hashes
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def _new_file_hasher():
+    """Hash object used for file hashes"""
+    return hashlib.blake2b(digest_size=32)
+
+
 def get_hash(path: Path) -> str:
-    """Get file hash"""
+    """Get file hash (BLAKE2b-256), streamed so large files are never fully loaded"""
     path = Path(path)
     if not path.exists():
         return ""
     
     with open(path, 'rb') as file_handle:
-        file_content = file_handle.read()
-        return hashlib.sha256(file_content).hexdigest()
+        # Python 3.11+: readinto loop over a reused buffer, no per-read allocation
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(file_handle, _new_file_hasher).hexdigest()
+        
+        hasher = _new_file_hasher()
+        for chunk in iter(lambda: file_handle.read(HASH_CHUNK_SIZE), b''):
+            hasher.update(chunk)
+        return hasher.hexdigest()
 
 
 def mkdir(path: Path) -> None:
     """Create directory with parents"""
-    Path(path).mkdir(parents=True, exist_ok=True) 
\ No newline at end of file
+    Path(path).mkdir(parents=True, exist_ok=True) 
+
+
+def iter_markdown_files(root: Path) -> Iterator[Path]:
+    """Yield markdown files under root as they are found
+    
+    Walks with os.scandir, reusing the directory entry's cached type
+    information. Like Path.rglob, symlinked directories are not descended into.
+    """
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith('.md') and entry.is_file():
+                            yield Path(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
@@ -15,6 +15,7 @@ IMPORTS = [
     ('docx', ['Document'], False, "python-docx not available"),
     ('PyPDF2', ['PdfReader'], False, "PyPDF2 not available"),
     ('requests', None, False, "requests not available"),
+    ('orjson', None, False, None),
     ('bs4', ['BeautifulSoup'], False, "beautifulsoup4 not available"),
     ('tenacity', ['retry', 'stop_after_attempt', 'wait_exponential', 'retry_if_exception_type'], False, "tenacity not available - retry logic disabled"),
     ('rich.progress', ['Progress', 'SpinnerColumn', 'TextColumn', 'BarColumn', 'TaskProgressColumn', 'TimeRemainingColumn'], False, "Rich progress not available")
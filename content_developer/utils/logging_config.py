@@ -15,6 +15,16 @@ from rich.logging import RichHandler
 console = Console()
 
 
+class LazyFileHandler(logging.FileHandler):
+    """File handler that creates its directory and opens the file on first emit"""
+    def __init__(self, filename, mode='a', encoding=None):
+        super().__init__(filename, mode=mode, encoding=encoding, delay=True)
+    
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
 class ConsoleFilter(logging.Filter):
     """Filter to only show WARNING and above on console"""
     def filter(self, record):
@@ -39,9 +49,8 @@ def setup_dual_logging(log_file: Optional[str] = None, console_level: str = "WAR
         log_file: Path to log file. If None, uses timestamp-based name
         console_level: Minimum level for console output (default: WARNING)
     """
-    # Create logs directory if it doesn't exist
+    # The logs directory is created by LazyFileHandler on the first record
     log_dir = Path("./logs")
-    log_dir.mkdir(exist_ok=True)
     
     # Generate log file name if not provided
     if log_file is None:
@@ -58,7 +67,7 @@ def setup_dual_logging(log_file: Optional[str] = None, console_level: str = "WAR
     root_logger.handlers.clear()
     
     # File handler - detailed logging
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler = LazyFileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     file_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
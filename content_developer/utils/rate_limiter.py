@@ -0,0 +1,101 @@
+"""
+Global rate limiter for LLM requests
+"""
+import threading
+import time
+from typing import Dict, List, Optional
+
+# Completion tokens counted per request when it sets no max_tokens. Token quotas
+# count the completion as well as the prompt, and Phase 3 completions are whole articles
+COMPLETION_TOKEN_ALLOWANCE = 4096
+
+
+def estimate_message_tokens(messages: List[Dict[str, str]], max_tokens: Optional[int] = None) -> int:
+    """Rough token count of a request for rate limiting
+    
+    The prompt is estimated at about 4 characters per token; the completion
+    counts as max_tokens, or COMPLETION_TOKEN_ALLOWANCE when that is not set.
+    """
+    prompt_tokens = sum(len(message.get("content") or "") for message in messages) // 4 + 1
+    return prompt_tokens + (max_tokens or COMPLETION_TOKEN_ALLOWANCE)
+
+
+class RateLimiter:
+    """Token buckets for requests and tokens per minute, shared by all threads
+    
+    Each bucket holds up to one minute of capacity and refills continuously,
+    so bursts up to the per-minute limit go through immediately and sustained
+    load is paced to the limit. A limit of 0 disables that bucket.
+    """
+    
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0):
+        self._lock = threading.Lock()
+        self.configure(requests_per_minute, tokens_per_minute)
+    
+    def configure(self, requests_per_minute: int = 0, tokens_per_minute: int = 0):
+        """Set the limits and start with full buckets"""
+        with self._lock:
+            self.requests_per_minute = max(0, requests_per_minute)
+            self.tokens_per_minute = max(0, tokens_per_minute)
+            self._request_capacity = float(self.requests_per_minute)
+            self._token_capacity = float(self.tokens_per_minute)
+            self._last_update = time.monotonic()
+    
+    @property
+    def enabled(self) -> bool:
+        """True if either limit is set"""
+        return bool(self.requests_per_minute or self.tokens_per_minute)
+    
+    def acquire(self, tokens: int = 0):
+        """Block until one request of roughly `tokens` tokens fits within the limits"""
+        if not self.enabled:
+            return
+        
+        while True:
+            with self._lock:
+                self._refill()
+                # A request larger than a whole minute's budget waits for a full bucket
+                needed_tokens = min(tokens, self.tokens_per_minute)
+                wait = max(
+                    self._seconds_until(1.0, self._request_capacity, self.requests_per_minute),
+                    self._seconds_until(needed_tokens, self._token_capacity, self.tokens_per_minute)
+                )
+                if wait <= 0:
+                    if self.requests_per_minute:
+                        self._request_capacity -= 1.0
+                    if self.tokens_per_minute:
+                        self._token_capacity -= needed_tokens
+                    return
+            time.sleep(wait)
+    
+    def _refill(self):
+        """Add the capacity earned since the last update, up to one minute's worth"""
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+        if self.requests_per_minute:
+            self._request_capacity = min(
+                float(self.requests_per_minute),
+                self._request_capacity + elapsed * self.requests_per_minute / 60.0
+            )
+        if self.tokens_per_minute:
+            self._token_capacity = min(
+                float(self.tokens_per_minute),
+                self._token_capacity + elapsed * self.tokens_per_minute / 60.0
+            )
+    
+    @staticmethod
+    def _seconds_until(needed: float, capacity: float, per_minute: int) -> float:
+        """Seconds until a bucket holds `needed` units (0 if it already does or is disabled)"""
+        if not per_minute or capacity >= needed:
+            return 0.0
+        return (needed - capacity) * 60.0 / per_minute
+
+
+# Global instance
+_rate_limiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the global rate limiter instance"""
+    return _rate_limiter
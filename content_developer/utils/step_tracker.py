@@ -1,25 +1,37 @@
 """
 Global step tracker for managing LLM call step numbers
 """
-from typing import Dict
+from itertools import count
+from typing import Dict, Iterator
+
+from ..constants import MAX_PHASES
 
 
 class StepTracker:
-    """Tracks step numbers globally across all processors"""
+    """Tracks step numbers globally across all processors
+    
+    Each phase owns an itertools.count; advancing it is a single C-level call,
+    so concurrent processors never hand out the same step number.
+    """
     
     def __init__(self):
-        self.phase_steps: Dict[int, int] = {1: 0, 2: 0, 3: 0, 4: 0}
-        
+        phases = range(1, MAX_PHASES + 1)
+        self._counters: Dict[int, Iterator[int]] = {phase: count(1) for phase in phases}
+        self.phase_steps: Dict[int, int] = {phase: 0 for phase in phases}
+    
     def get_next_step(self, phase: int) -> int:
         """Get the next step number for a phase and increment the counter"""
-        self.phase_steps[phase] += 1
-        return self.phase_steps[phase]
+        counter = self._counters.get(phase)
+        if counter is None:
+            counter = self._counters.setdefault(phase, count(1))
+        step = next(counter)
+        self.phase_steps[phase] = step
+        return step
     
     def reset_phase(self, phase: int):
         """Reset step counter for a phase (optional)"""
+        self._counters[phase] = count(1)
         self.phase_steps[phase] = 0
-    
-
 
 
 # Global instance
@@ -28,4 +40,4 @@ _step_tracker = StepTracker()
 
 def get_step_tracker() -> StepTracker:
     """Get the global step tracker instance"""
-    return _step_tracker 
\ No newline at end of file
+    return _step_tracker
@@ -31,9 +31,16 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        # Optional speedups; everything falls back to the standard library without them
+        "fast": [
+            "requests-cache>=1.1.0",  # On-disk cache for GitHub API probes
+            "orjson>=3.9.0",  # Faster JSON for the embeddings cache and manifest
+        ],
+    },
     entry_points={
         "console_scripts": [
-            "ai-content-dev=content_developer.main:main",
+            "ai-content-dev=content_developer.cli:main",
         ],
     },
     include_package_data=True,